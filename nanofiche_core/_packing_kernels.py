@@ -0,0 +1,277 @@
+"""
+Compiled inner loops for NanoFiche packing.
+Numba is optional; when it is not installed NUMBA_AVAILABLE is False and
+the packer keeps using its own Python/NumPy implementations.
+"""
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on environment
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Stand-in decorator that leaves the function as plain Python."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True, nogil=True)
+def sweep_circle_reserve(bin_width, bin_height, center_x, center_y, radius_sq,
+                         reserve_left, reserve_top, reserve_right, reserve_bottom, reserve_enabled,
+                         canvas_size, num_bins, out, write=True):
+    """
+    Row-by-row sweep placing bins whose center lies inside the circle and
+    which do not overlap the reserve rectangle.
+
+    Writes (x, y) pairs into out, unless write is False, and returns the number
+    of bins placed.
+    """
+    half_width = bin_width // 2
+    half_height = bin_height // 2
+    num_cols = canvas_size // bin_width
+    num_rows = canvas_size // bin_height
+    radius = math.sqrt(radius_sq)
+    # Tile-center offsets are integers, so dx² + dy² <= r² exactly when it is <= floor(r²)
+    radius_sq_int = int(math.floor(radius_sq))
+    count = 0
+
+    # Only rows whose tile centers can lie within the disk; the exact test below trims the edges
+    first_row = max(0, int(math.floor((center_y - half_height - radius) / bin_height)))
+    end_row = min(num_rows, int(math.floor((center_y - half_height + radius) / bin_height)) + 2)
+
+    for row in range(first_row, end_row):
+        if count >= num_bins:
+            break
+        current_y = row * bin_height
+        dy = current_y + half_height - center_y
+        dy_sq = dy * dy
+        if dy_sq > radius_sq:
+            continue
+
+        # Most rows lie fully above or below the reserve; test it only where it can hit
+        row_hits_reserve = (reserve_enabled and
+                            current_y + bin_height > reserve_top and current_y < reserve_bottom)
+
+        # Columns whose tile centers fall within the chord of the disk at this row
+        half_chord = math.sqrt(radius_sq - dy_sq)
+        first_col = max(0, int(math.floor((center_x - half_width - half_chord) / bin_width)))
+        end_col = min(num_cols, int(math.floor((center_x - half_width + half_chord) / bin_width)) + 2)
+
+        for col in range(first_col, end_col):
+            if count >= num_bins:
+                break
+            current_x = col * bin_width
+            dx = current_x + half_width - center_x
+            if dx * dx + dy_sq <= radius_sq_int:
+                # Non-short-circuit & keeps the reserve test a single branch in the compiled loop
+                if not (row_hits_reserve & (current_x + bin_width > reserve_left) & (current_x < reserve_right)):
+                    if write:
+                        out[count, 0] = current_x
+                        out[count, 1] = current_y
+                    count += 1
+
+    return count
+
+
+@njit(cache=True, nogil=True)
+def count_circle_reserve(bin_width, bin_height, center_x, center_y, radius_sq,
+                         reserve_left, reserve_top, reserve_right, reserve_bottom, reserve_enabled,
+                         canvas_size, num_bins):
+    """Number of bins sweep_circle_reserve would place, without writing any placements."""
+    return sweep_circle_reserve(bin_width, bin_height, center_x, center_y, radius_sq,
+                                reserve_left, reserve_top, reserve_right, reserve_bottom, reserve_enabled,
+                                canvas_size, num_bins, np.empty((0, 2), dtype=np.int32), False)
+
+
+@njit(cache=True, nogil=True)
+def sweep_circle_square_reserve(bin_width, bin_height, circle_radius, square_reserve_size, num_bins, out):
+    """
+    Row-by-row sweep of a circle of the given radius with a centered square reserve,
+    placing bins whose center lies inside the circle and which do not overlap the reserve.
+
+    Writes (x, y) pairs into out and returns the number of bins placed.
+    """
+    canvas_size = int(2 * circle_radius)
+    center_x = canvas_size // 2
+    center_y = center_x
+    half_width = bin_width // 2
+    half_height = bin_height // 2
+    radius_sq_int = int(math.floor(circle_radius * circle_radius))
+
+    square_half_size = square_reserve_size // 2
+    square_left = center_x - square_half_size
+    square_right = center_x + square_half_size
+    square_top = center_y - square_half_size
+    square_bottom = center_y + square_half_size
+
+    count = 0
+    current_y = 0
+    while count < num_bins and current_y + bin_height <= canvas_size:
+        dy = current_y + half_height - center_y
+        dy_sq = dy * dy
+        row_hits_reserve = current_y + bin_height > square_top and current_y < square_bottom
+
+        current_x = 0
+        while count < num_bins and current_x + bin_width <= canvas_size:
+            dx = current_x + half_width - center_x
+            if dx * dx + dy_sq <= radius_sq_int:
+                if not (row_hits_reserve & (current_x + bin_width > square_left) & (current_x < square_right)):
+                    out[count, 0] = current_x
+                    out[count, 1] = current_y
+                    count += 1
+            current_x += bin_width
+
+        current_y += bin_height
+
+    return count
+
+
+@njit(cache=True, nogil=True)
+def circle_square_reserve_capacity(bin_width, bin_height, circle_radius, square_reserve_size):
+    """
+    Number of bins sweep_circle_square_reserve would place with no bin limit.
+
+    Each row contributes its run of columns inside the circle minus the
+    columns blocked by the square reserve, found from the chord and settled
+    with the exact tile test rather than testing every tile.
+    """
+    canvas_size = int(2 * circle_radius)
+    center_x = canvas_size // 2
+    center_y = center_x
+    half_width = bin_width // 2
+    half_height = bin_height // 2
+    num_cols = canvas_size // bin_width
+    num_rows = canvas_size // bin_height
+    radius_sq = circle_radius * circle_radius
+    radius_sq_int = int(math.floor(radius_sq))
+    if num_cols <= 0:
+        return 0
+
+    # Columns and row extent blocked by the center square reserve
+    square_half_size = square_reserve_size // 2
+    reserve_first_col = max((center_x - square_half_size) // bin_width, 0)
+    reserve_end_col = min(-(-(center_x + square_half_size) // bin_width), num_cols)
+    square_top = center_y - square_half_size
+    square_bottom = center_y + square_half_size
+
+    # The column whose tile center is closest to the circle center
+    nearest = min(max((center_x - half_width) // bin_width, 0), num_cols - 1)
+    if nearest + 1 < num_cols and abs((nearest + 1) * bin_width + half_width - center_x) < \
+            abs(nearest * bin_width + half_width - center_x):
+        nearest += 1
+    nearest_dx = nearest * bin_width + half_width - center_x
+
+    capacity = 0
+    for row in range(num_rows):
+        y = row * bin_height
+        dy = y + half_height - center_y
+        dy_sq = dy * dy
+        if nearest_dx * nearest_dx + dy_sq > radius_sq_int:
+            continue
+
+        # Start from the chord estimate and settle each end with the exact test
+        half_chord = math.sqrt(max(0.0, radius_sq - dy_sq))
+        first = min(max(int(math.ceil((center_x - half_width - half_chord) / bin_width)), 0), nearest)
+        while first > 0:
+            dx = (first - 1) * bin_width + half_width - center_x
+            if dx * dx + dy_sq > radius_sq_int:
+                break
+            first -= 1
+        while True:
+            dx = first * bin_width + half_width - center_x
+            if dx * dx + dy_sq <= radius_sq_int:
+                break
+            first += 1
+
+        last = max(min(int(math.floor((center_x - half_width + half_chord) / bin_width)), num_cols - 1), nearest)
+        while last < num_cols - 1:
+            dx = (last + 1) * bin_width + half_width - center_x
+            if dx * dx + dy_sq > radius_sq_int:
+                break
+            last += 1
+        while True:
+            dx = last * bin_width + half_width - center_x
+            if dx * dx + dy_sq <= radius_sq_int:
+                break
+            last -= 1
+
+        row_count = last + 1 - first
+        if y + bin_height > square_top and y < square_bottom:
+            row_count -= max(0, min(last + 1, reserve_end_col) - max(first, reserve_first_col))
+        capacity += row_count
+
+    return capacity
+
+
+@njit(cache=True, nogil=True)
+def fill_ellipse_grid(bin_width, bin_height, rows, cols, start_x, start_y, center_x, center_y,
+                      a, b, limit, num_bins, out):
+    """
+    Row-by-row walk of a rows x cols grid placing bins whose center satisfies
+    ((x-cx)/a)² + ((y-cy)/b)² <= limit.
+
+    Writes (x, y) pairs into out and returns the number of bins placed.
+    """
+    half_width = bin_width // 2
+    half_height = bin_height // 2
+    count = 0
+
+    # Only rows whose bin centers can lie within the ellipse; the exact test below trims the edges
+    y_reach = abs(b) * math.sqrt(limit)
+    first_row = max(0, int(math.floor((center_y - y_reach - start_y - half_height) / bin_height)))
+    end_row = min(rows, int(math.floor((center_y + y_reach - start_y - half_height) / bin_height)) + 2)
+
+    for row in range(first_row, end_row):
+        if count >= num_bins:
+            break
+        y = start_y + row * bin_height
+        ny = (y + half_height - center_y) / b
+        ny_sq = ny * ny
+        if ny_sq > limit:
+            continue
+
+        # Columns whose bin centers fall within the ellipse's chord at this row
+        x_reach = abs(a) * math.sqrt(limit - ny_sq)
+        first_col = max(0, int(math.floor((center_x - x_reach - start_x - half_width) / bin_width)))
+        end_col = min(cols, int(math.floor((center_x + x_reach - start_x - half_width) / bin_width)) + 2)
+
+        # The passing columns are one contiguous run inside that range, so only its ends need
+        # the exact test (and its divisions); every column between them passes
+        while first_col < end_col:
+            nx = (start_x + first_col * bin_width + half_width - center_x) / a
+            if nx * nx + ny_sq <= limit:
+                break
+            first_col += 1
+        while end_col > first_col:
+            nx = (start_x + (end_col - 1) * bin_width + half_width - center_x) / a
+            if nx * nx + ny_sq <= limit:
+                break
+            end_col -= 1
+
+        for col in range(first_col, min(end_col, first_col + num_bins - count)):
+            out[count, 0] = start_x + col * bin_width
+            out[count, 1] = y
+            count += 1
+
+    return count
+
+
+def warm_up():
+    """
+    Compile every kernel once on a tiny input, so the first real packing (or
+    each forked worker process) does not pay the JIT cost.
+    """
+    if not NUMBA_AVAILABLE:
+        return
+    out = np.empty((1, 2), dtype=np.int32)
+    sweep_circle_reserve(1, 1, 1, 1, 1.0, 0, 0, 0, 0, False, 2, 1, out)
+    count_circle_reserve(1, 1, 1, 1, 1.0, 0, 0, 0, 0, False, 2, 1)
+    sweep_circle_square_reserve(1, 1, 1.0, 0, 1, out)
+    circle_square_reserve_capacity(1, 1, 1.0, 0)
+    fill_ellipse_grid(1, 1, 1, 1, 0, 0, 0, 0, 1.0, 1.0, 0.8, 1, out)
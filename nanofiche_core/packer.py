@@ -4,11 +4,24 @@ Handles square, rectangle, circle, and ellipse envelope shapes.
 """
 
 import math
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
 from enum import Enum
+from functools import lru_cache
 from typing import List, Tuple, Optional
 import logging
 
+import numpy as np
+
+from ._packing_kernels import (
+    NUMBA_AVAILABLE, circle_square_reserve_capacity, count_circle_reserve, fill_ellipse_grid,
+    sweep_circle_reserve, sweep_circle_square_reserve, warm_up
+)
+
+# Circle radius bounds are r = sqrt(area / π) and the same for 3x the area
+_INV_PI = 1.0 / math.pi
+_SQRT_3 = math.sqrt(3.0)
+
 
 class EnvelopeShape(Enum):
     """Supported envelope shapes."""
@@ -54,12 +67,103 @@ class PackingResult:
     columns: int
     canvas_width: int
     canvas_height: int
-    placements: List[Tuple[int, int]]  # (x, y) coordinates for each bin
+    placements: np.ndarray = field(compare=False)  # (N, 2) int32 array of (x, y) coordinates for each bin
     envelope_shape: EnvelopeShape
     total_bins: int
     bin_width: int
     bin_height: int
     envelope_spec: EnvelopeSpec = None  # Optional envelope specification for reserved space
+    
+    def __post_init__(self):
+        """Store placements as a compact, C-contiguous (N, 2) int32 array."""
+        placements = np.ascontiguousarray(self.placements, dtype=np.int32)
+        if placements.size == 0:
+            placements = placements.reshape(0, 2)
+        elif placements.ndim != 2 or placements.shape[1] != 2:
+            raise ValueError(f"placements must be (x, y) pairs, got an array of shape {placements.shape}")
+        self.placements = placements
+    
+    def __eq__(self, other):
+        """Field-wise equality, comparing placements element-wise."""
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (all(getattr(self, f.name) == getattr(other, f.name) for f in fields(self) if f.compare)
+                and np.array_equal(self.placements, other.placements))
+    
+    def __iter__(self):
+        """Iterate placements as (x, y) tuples."""
+        return iter(map(tuple, self.placements.tolist()))
+    
+    @property
+    def xs(self) -> np.ndarray:
+        """x coordinate of every bin, as a view into placements."""
+        return self.placements[:, 0]
+    
+    @property
+    def ys(self) -> np.ndarray:
+        """y coordinate of every bin, as a view into placements."""
+        return self.placements[:, 1]
+    
+    def linear_indices(self, canvas_width: Optional[int] = None) -> np.ndarray:
+        """Flat canvas index y * canvas_width + x of each bin's top-left corner, as an int64 array."""
+        if canvas_width is None:
+            canvas_width = self.canvas_width
+        return self.ys.astype(np.int64) * canvas_width + self.xs
+
+
+def _isqrt_ceil(n: int) -> int:
+    """Smallest integer side with side * side >= n, in exact integer arithmetic."""
+    if n <= 0:
+        return 0
+    side = math.isqrt(n)
+    return side + (side * side < n)
+
+
+@lru_cache(maxsize=1024)
+def _optimal_grid(num_bins: int, target_aspect: float, bin_width: int, bin_height: int) -> Tuple[int, int]:
+    """Find optimal rows/columns for rectangular packing; cached since packers repeat the same query."""
+    # Every row count from 1 to num_bins is a candidate, but ceil(num_bins / rows) takes only O(sqrt(N))
+    # distinct values. For a fixed column count the score is convex in rows while the grid is wider than
+    # the target and increasing once it is taller, so only a few rows per column count can win.
+    candidate_rows = set()
+    turning_rows = (1000 // bin_height, 1000 // bin_height + 1)  # Where aspect and area terms balance
+    rows = 1
+    while rows <= num_bins:
+        cols = -(-num_bins // rows)
+        last_rows = (num_bins - 1) // (cols - 1) if cols > 1 else num_bins
+        group = [rows, last_rows, *turning_rows]
+        if target_aspect > 0:
+            # Grid aspect crosses the target here
+            crossing = cols * bin_width / (bin_height * target_aspect)
+            group += [math.floor(crossing), math.floor(crossing) + 1]
+        candidate_rows.update(min(max(r, rows), last_rows) for r in group)
+        rows = last_rows + 1
+    
+    best_score = float('inf')
+    best_rows = best_cols = 1
+    
+    # Visit candidates in increasing order so ties resolve to the fewest rows, as in a full scan
+    for rows in sorted(candidate_rows):
+        cols = -(-num_bins // rows)
+        
+        # Calculate grid dimensions
+        grid_width = cols * bin_width
+        grid_height = rows * bin_height
+        grid_aspect = grid_width / grid_height
+        
+        # Score based on how close to target aspect ratio
+        aspect_error = abs(grid_aspect - target_aspect)
+        area = grid_width * grid_height
+        
+        # Combine aspect error and area (prefer smaller area)
+        score = aspect_error + (area / 1000000)  # Normalize area
+        
+        if score < best_score:
+            best_score = score
+            best_rows = rows
+            best_cols = cols
+    
+    return best_rows, best_cols
 
 
 class NanoFichePacker:
@@ -76,6 +180,11 @@ class NanoFichePacker:
         self.bin_width = bin_width
         self.bin_height = bin_height
         self.logger = logging.getLogger(__name__)
+        # (key, rows) of the last canvas seen by the circular row layout and of the last ellipse
+        # seen by the raster fill; each is replaced in one assignment so threads sharing the packer
+        # never pair a key with another key's rows
+        self._circular_rows = None
+        self._ellipse_rows = None
     
     def pack(self, num_bins: int, envelope_spec: EnvelopeSpec) -> PackingResult:
         """
@@ -88,9 +197,10 @@ class NanoFichePacker:
         Returns:
             PackingResult with optimal layout
         """
-        self.logger.info(f"Packing {num_bins} bins into {envelope_spec.shape.value} envelope")
+        self.logger.info("Packing %d bins into %s envelope", num_bins, envelope_spec.shape.value)
         if envelope_spec.reserve_enabled:
-            self.logger.info(f"Reserved space: {envelope_spec.reserve_width}x{envelope_spec.reserve_height} at {envelope_spec.reserve_position}")
+            self.logger.info("Reserved space: %sx%s at %s", envelope_spec.reserve_width, envelope_spec.reserve_height,
+                             envelope_spec.reserve_position)
         
         if envelope_spec.shape == EnvelopeShape.SQUARE:
             if envelope_spec.reserve_enabled:
@@ -113,29 +223,60 @@ class NanoFichePacker:
         else:
             raise ValueError(f"Unsupported envelope shape: {envelope_spec.shape}")
     
-    def _pack_square(self, num_bins: int) -> PackingResult:
-        """Pack bins into a square envelope with maximum optimization."""
-        # Zero-waste approach: find minimum square size for exact capacity
-        canvas_size = 1
-        while True:
-            cols = canvas_size // self.bin_width
-            rows = canvas_size // self.bin_height
-            capacity = cols * rows
-            
-            if capacity >= num_bins:
-                break
-            canvas_size += 1
+    def pack_many(self, specs: List[Tuple[int, EnvelopeSpec]], max_workers: Optional[int] = None) -> List[PackingResult]:
+        """
+        Calculate packings for several (num_bins, envelope_spec) requests concurrently.
         
-        # Fine-tune to minimize area while maintaining capacity
-        while True:
-            test_size = canvas_size - 1
-            test_cols = test_size // self.bin_width
-            test_rows = test_size // self.bin_height
-            test_capacity = test_cols * test_rows
+        Useful when comparing envelope shapes for the same image set. With Numba the
+        hot loops are NumPy or nogil kernels, so the requests run on threads; without
+        it the Python fallback loops hold the GIL, so they are fanned out to worker
+        processes instead. Either way each spec is left as pack() would leave it.
+        
+        Args:
+            specs: List of (num_bins, envelope_spec) pairs to pack
+            max_workers: Maximum number of workers (defaults to CPU count)
             
-            if test_capacity < num_bins:
-                break
-            canvas_size = test_size
+        Returns:
+            List of PackingResult in the same order as specs
+        """
+        if len(specs) <= 1:
+            return [self.pack(num_bins, envelope_spec) for num_bins, envelope_spec in specs]
+        
+        num_bins_list = [num_bins for num_bins, _ in specs]
+        envelope_specs = [envelope_spec for _, envelope_spec in specs]
+        
+        if NUMBA_AVAILABLE:
+            # Compile (or load) the kernels once here rather than racing to do it in every thread
+            warm_up()
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                return list(executor.map(self.pack, num_bins_list, envelope_specs))
+        
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(self.pack, num_bins_list, envelope_specs))
+        
+        # Workers pack a pickled copy of each spec; carry their updates (e.g. an optimized
+        # reserve size) back to the caller's spec
+        for envelope_spec, result in zip(envelope_specs, results):
+            if result.envelope_spec is not None:
+                vars(envelope_spec).update(vars(result.envelope_spec))
+                result.envelope_spec = envelope_spec
+        
+        return results
+    
+    def _pack_square(self, num_bins: int) -> PackingResult:
+        """Pack bins into a square envelope with maximum optimization."""
+        # Zero-waste approach: the minimum square holding num_bins is max(cols * bin_width, rows * bin_height)
+        # for the best grid with rows = ceil(num_bins / cols). Either cols or rows is at most ceil(sqrt(N)),
+        # so scanning both small sides covers every grid that can be optimal.
+        if num_bins > 0:
+            small_sides = np.arange(1, _isqrt_ceil(num_bins) + 1, dtype=np.int64)
+            other_sides = -(-num_bins // small_sides)
+            canvas_size = int(min(
+                np.maximum(small_sides * self.bin_width, other_sides * self.bin_height).min(),
+                np.maximum(other_sides * self.bin_width, small_sides * self.bin_height).min()
+            ))
+        else:
+            canvas_size = 0
         
         # Calculate final grid
         columns = canvas_size // self.bin_width
@@ -148,13 +289,7 @@ class NanoFichePacker:
         offset_y = (canvas_size - grid_height) // 2
         
         # Generate placements (centered in square canvas)
-        placements = []
-        for i in range(num_bins):
-            row = i // columns
-            col = i % columns
-            x = offset_x + col * self.bin_width
-            y = offset_y + row * self.bin_height
-            placements.append((x, y))
+        placements = self._grid_placements(num_bins, columns, offset_x, offset_y)
         
         return PackingResult(
             rows=rows,
@@ -168,75 +303,140 @@ class NanoFichePacker:
             bin_height=self.bin_height
         )
     
-    def _check_overlap_with_reserve(self, x: int, y: int, envelope_spec: EnvelopeSpec, canvas_width: int, canvas_height: int) -> bool:
-        """Check if a bin at position (x, y) overlaps with reserved space."""
-        if not envelope_spec.reserve_enabled:
-            return False
-            
-        # Calculate reserve position
+    def _reserve_bounds(self, envelope_spec: EnvelopeSpec, canvas_width: int, canvas_height: int) -> Tuple[int, int, int, int]:
+        """Return the reserved space as (left, top, right, bottom) on the canvas."""
         if envelope_spec.reserve_position == "center":
             reserve_x = (canvas_width - envelope_spec.reserve_width) // 2
             reserve_y = (canvas_height - envelope_spec.reserve_height) // 2
         else:  # top-left
             reserve_x = 0
             reserve_y = 0
+        return (reserve_x, reserve_y,
+                reserve_x + envelope_spec.reserve_width, reserve_y + envelope_spec.reserve_height)
+    
+    def _grid_placements(self, num_bins: int, columns: int, offset_x: int, offset_y: int,
+                         out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Place num_bins bins row by row on a grid of the given width, as an (N, 2) int32 array.
         
-        # Check overlap
-        bin_right = x + self.bin_width
-        bin_bottom = y + self.bin_height
-        reserve_right = reserve_x + envelope_spec.reserve_width
-        reserve_bottom = reserve_y + envelope_spec.reserve_height
+        When out is given the placements are written into it instead of a new array.
+        """
+        row, col = np.divmod(np.arange(num_bins, dtype=np.int64), max(columns, 1))
+        placements = np.empty((num_bins, 2), dtype=np.int32) if out is None else out
+        placements[:, 0] = offset_x + col * self.bin_width
+        placements[:, 1] = offset_y + row * self.bin_height
+        return placements
+    
+    def _grid_placements_avoiding_reserve(self, num_bins: int, rows: int, columns: int, offset_x: int, offset_y: int,
+                                          envelope_spec: EnvelopeSpec, canvas_width: int, canvas_height: int) -> np.ndarray:
+        """Place up to num_bins bins row by row on a grid, skipping cells that overlap reserved space."""
+        xs = offset_x + np.arange(columns, dtype=np.int64) * self.bin_width
+        ys = offset_y + np.arange(rows, dtype=np.int64) * self.bin_height
+        
+        free = np.ones((rows, columns), dtype=bool)
+        if envelope_spec.reserve_enabled:
+            reserve_x, reserve_y, reserve_right, reserve_bottom = self._reserve_bounds(
+                envelope_spec, canvas_width, canvas_height
+            )
+            
+            # A cell overlaps the reserve when both its column and its row overlap it
+            cols_overlap = np.flatnonzero((xs + self.bin_width > reserve_x) & (xs < reserve_right))
+            rows_overlap = np.flatnonzero((ys + self.bin_height > reserve_y) & (ys < reserve_bottom))
+            # Both are contiguous runs, so the blocked cells form one sub-block of the grid
+            if rows_overlap.size and cols_overlap.size:
+                free[rows_overlap[0]:rows_overlap[-1] + 1, cols_overlap[0]:cols_overlap[-1] + 1] = False
+        
+        # np.nonzero walks the mask in row-major order, matching top-left to bottom-right placement
+        row_idx, col_idx = np.nonzero(free)
+        row_idx = row_idx[:num_bins]
+        col_idx = col_idx[:num_bins]
+        
+        return np.stack([xs[col_idx], ys[row_idx]], axis=1).astype(np.int32)
+    
+    def _count_cells_overlapping_reserve(self, rows: int, columns: int, envelope_spec: EnvelopeSpec,
+                                         canvas_width: int, canvas_height: int) -> int:
+        """Count the cells of a centered rows x columns grid that _grid_placements_avoiding_reserve would skip."""
+        if not envelope_spec.reserve_enabled:
+            return 0
+        
+        offset_x = (canvas_width - columns * self.bin_width) // 2
+        offset_y = (canvas_height - rows * self.bin_height) // 2
+        reserve_x, reserve_y, reserve_right, reserve_bottom = self._reserve_bounds(
+            envelope_spec, canvas_width, canvas_height
+        )
+        
+        # Cell i overlaps [start, end) along an axis for floor(lo) <= i < ceil(hi)
+        first_col = (reserve_x - offset_x) // self.bin_width
+        end_col = -((offset_x - reserve_right) // self.bin_width)
+        first_row = (reserve_y - offset_y) // self.bin_height
+        end_row = -((offset_y - reserve_bottom) // self.bin_height)
+        
+        overlap_cols = max(0, min(columns, end_col) - max(0, first_col))
+        overlap_rows = max(0, min(rows, end_row) - max(0, first_row))
+        return overlap_cols * overlap_rows
+    
+    def _fit_canvas_to_aspect(self, grid_width: int, grid_height: int, target_aspect: float) -> Tuple[int, int]:
+        """Grow the grid's bounding box along one axis to match the target aspect ratio."""
+        if grid_width / grid_height > target_aspect:
+            # Grid is too wide, adjust height
+            return grid_width, int(grid_width / target_aspect)
+        # Grid is too tall, adjust width
+        return int(grid_height * target_aspect), grid_height
+    
+    def _square_with_reserve_fits(self, num_bins: int, side: int, envelope_spec: EnvelopeSpec) -> bool:
+        """Check whether a side x side grid holds all bins once the reserve's cells are removed, without placing them."""
+        canvas_size = max(side * self.bin_width, side * self.bin_height)
+        lost = self._count_cells_overlapping_reserve(side, side, envelope_spec, canvas_size, canvas_size)
+        return side * side - lost >= num_bins
+    
+    def _try_pack_square_with_reserve(self, num_bins: int, side: int, envelope_spec: EnvelopeSpec) -> Optional[np.ndarray]:
+        """Try to place all bins on a side x side grid avoiding reserve; returns None if they don't fit."""
+        grid_width = side * self.bin_width
+        grid_height = side * self.bin_height
+        canvas_size = max(grid_width, grid_height)
+        
+        offset_x = (canvas_size - grid_width) // 2
+        offset_y = (canvas_size - grid_height) // 2
+        placements = self._grid_placements_avoiding_reserve(
+            num_bins, side, side, offset_x, offset_y, envelope_spec, canvas_size, canvas_size
+        )
         
-        # No overlap if bin is completely outside reserve
-        return not (bin_right <= reserve_x or x >= reserve_right or 
-                   bin_bottom <= reserve_y or y >= reserve_bottom)
+        if len(placements) < num_bins:
+            return None
+        return placements
     
     def _pack_square_with_reserve(self, num_bins: int, envelope_spec: EnvelopeSpec) -> PackingResult:
-        """Pack bins into square with reserved space."""
-        # Start with normal square size and increase if needed
-        side = math.ceil(math.sqrt(num_bins))
-        found_solution = False
-        max_attempts = 50
-        attempts = 0
+        """Pack bins into square with reserved space using binary search on the grid side."""
+        # Lower bound: normal square grid without reserve
+        side_min = _isqrt_ceil(num_bins)
         
-        while not found_solution and attempts < max_attempts:
-            rows = side
-            columns = side
-            grid_width = columns * self.bin_width
-            grid_height = rows * self.bin_height
-            canvas_size = max(grid_width, grid_height)
-            
-            # Try to place all bins avoiding reserve
-            placements = []
-            offset_x = (canvas_size - grid_width) // 2
-            offset_y = (canvas_size - grid_height) // 2
-            
-            for row in range(rows):
-                for col in range(columns):
-                    if len(placements) >= num_bins:
-                        break
-                    x = offset_x + col * self.bin_width
-                    y = offset_y + row * self.bin_height
-                    
-                    # Check if this position overlaps with reserve
-                    if not self._check_overlap_with_reserve(x, y, envelope_spec, canvas_size, canvas_size):
-                        placements.append((x, y))
-                
-                if len(placements) >= num_bins:
-                    break
+        # Upper bound: enough extra cells to absorb every cell the reserve can overlap
+        reserve_cells = 0
+        if envelope_spec.reserve_enabled:
+            reserve_cols = -(-envelope_spec.reserve_width // self.bin_width) + 1
+            reserve_rows = -(-envelope_spec.reserve_height // self.bin_height) + 1
+            reserve_cells = reserve_cols * reserve_rows
+        side_max = _isqrt_ceil(num_bins + reserve_cells) + 1
+        
+        # Binary search for the smallest side that still fits all bins (capacity only, no placements)
+        while side_min < side_max:
+            side_mid = (side_min + side_max) // 2
             
-            if len(placements) >= num_bins:
-                found_solution = True
+            if self._square_with_reserve_fits(num_bins, side_mid, envelope_spec):
+                side_max = side_mid
             else:
-                side += 1  # Increase grid size
-                attempts += 1
+                side_min = side_mid + 1
+        
+        side = side_max
+        best_placements = self._try_pack_square_with_reserve(num_bins, side, envelope_spec)
+        canvas_size = max(side * self.bin_width, side * self.bin_height)
         
         return PackingResult(
-            rows=rows,
-            columns=columns,
+            rows=side,
+            columns=side,
             canvas_width=canvas_size,
             canvas_height=canvas_size,
-            placements=placements[:num_bins],
+            placements=best_placements,
             envelope_shape=EnvelopeShape.SQUARE,
             total_bins=num_bins,
             bin_width=self.bin_width,
@@ -250,14 +450,17 @@ class NanoFichePacker:
         if (envelope_spec and hasattr(envelope_spec, 'reserve_aspect_x') and hasattr(envelope_spec, 'reserve_aspect_y') 
             and envelope_spec.reserve_aspect_x and envelope_spec.reserve_aspect_y):
             reserve_aspect_ratio = envelope_spec.reserve_aspect_x / envelope_spec.reserve_aspect_y
-            self.logger.info(f"Using reserve-specific aspect ratio: {envelope_spec.reserve_aspect_x}:{envelope_spec.reserve_aspect_y} = {reserve_aspect_ratio:.3f}")
+            self.logger.info("Using reserve-specific aspect ratio: %s:%s = %.3f",
+                             envelope_spec.reserve_aspect_x, envelope_spec.reserve_aspect_y, reserve_aspect_ratio)
         elif envelope_spec and hasattr(envelope_spec, 'aspect_x') and hasattr(envelope_spec, 'aspect_y') and envelope_spec.aspect_x and envelope_spec.aspect_y:
             reserve_aspect_ratio = envelope_spec.aspect_x / envelope_spec.aspect_y
-            self.logger.info(f"Using envelope aspect ratio: {envelope_spec.aspect_x}:{envelope_spec.aspect_y} = {reserve_aspect_ratio:.3f}")
+            self.logger.info("Using envelope aspect ratio: %s:%s = %.3f",
+                             envelope_spec.aspect_x, envelope_spec.aspect_y, reserve_aspect_ratio)
         else:
             # Fallback to image aspect ratio
             reserve_aspect_ratio = self.bin_width / self.bin_height
-            self.logger.info(f"Using default image aspect ratio: {self.bin_width}:{self.bin_height} = {reserve_aspect_ratio:.3f}")
+            self.logger.info("Using default image aspect ratio: %s:%s = %.3f",
+                             self.bin_width, self.bin_height, reserve_aspect_ratio)
         
         # Reserve area should be roughly 1-2 image areas
         reserve_area = 1.5 * self.bin_width * self.bin_height
@@ -277,21 +480,30 @@ class NanoFichePacker:
         
         return int(reserve_width), int(reserve_height)
     
-    def _try_pack_square_with_optimized_reserve(self, num_bins: int, side_length: float, envelope_spec: EnvelopeSpec) -> Tuple[bool, List, Tuple[int, int]]:
-        """Try to pack bins in square with optimized top-left reserve for perfect bottom row fill."""
+    def _plan_square_with_optimized_reserve(self, num_bins: int, side_length: float,
+                                            envelope_spec: EnvelopeSpec) -> Tuple[int, int, int, int, int, int]:
+        """
+        Size the top-left reserve and the two packing areas for a square of given side.
+        
+        Returns:
+            (reserve_width, reserve_height, top_right_cols, top_right_rows, bottom_cols, bottom_rows)
+        """
         reserve_width, reserve_height = self._calculate_optimized_reserve_size(side_length, envelope_spec)
         
+        # Bins sit on whole pixels, so only the integer part of the side matters
+        side = int(side_length)
+        
         # Calculate initial capacity
-        top_right_width = side_length - reserve_width
+        top_right_width = side - reserve_width
         top_right_height = reserve_height
-        top_right_cols = int(top_right_width / self.bin_width)
-        top_right_rows = int(top_right_height / self.bin_height)
+        top_right_cols = top_right_width // self.bin_width
+        top_right_rows = top_right_height // self.bin_height
         top_right_capacity = top_right_cols * top_right_rows
         
-        bottom_width = side_length
-        bottom_height = side_length - reserve_height
-        bottom_cols = int(bottom_width / self.bin_width)
-        bottom_rows = int(bottom_height / self.bin_height)
+        bottom_width = side
+        bottom_height = side - reserve_height
+        bottom_cols = bottom_width // self.bin_width
+        bottom_rows = bottom_height // self.bin_height
         bottom_capacity = bottom_cols * bottom_rows
         
         total_capacity = top_right_capacity + bottom_capacity
@@ -316,82 +528,78 @@ class NanoFichePacker:
                         extra_width_needed = empty_slots_in_last_row * self.bin_width
                         reserve_width += extra_width_needed
                         
-                        # Recalculate with new reserve width
-                        top_right_width = side_length - reserve_width
-                        top_right_cols = int(top_right_width / self.bin_width)
-                        top_right_capacity = top_right_cols * top_right_rows
-                        total_capacity = top_right_capacity + bottom_capacity
+                        # The reserve grew by whole bin widths, so the top-right area loses exactly that many columns
+                        top_right_cols -= empty_slots_in_last_row
         
-        placements = []
-        bins_placed = 0
+        return reserve_width, reserve_height, top_right_cols, top_right_rows, bottom_cols, bottom_rows
+    
+    def _square_with_optimized_reserve_fits(self, num_bins: int, side_length: float, envelope_spec: EnvelopeSpec) -> bool:
+        """Check from the area capacities alone whether all bins fit, without building placements."""
+        _, _, top_right_cols, top_right_rows, bottom_cols, bottom_rows = self._plan_square_with_optimized_reserve(
+            num_bins, side_length, envelope_spec
+        )
+        capacity = max(0, top_right_cols) * top_right_rows + bottom_cols * max(0, bottom_rows)
+        return capacity >= num_bins
+    
+    def _try_pack_square_with_optimized_reserve(self, num_bins: int, side_length: float, envelope_spec: EnvelopeSpec) -> Tuple[bool, np.ndarray, Tuple[int, int]]:
+        """Try to pack bins in square with optimized top-left reserve for perfect bottom row fill."""
+        reserve_width, reserve_height, top_right_cols, top_right_rows, bottom_cols, bottom_rows = \
+            self._plan_square_with_optimized_reserve(num_bins, side_length, envelope_spec)
         
-        # Area 1: Top-right rectangle
-        for row in range(top_right_rows):
-            if bins_placed >= num_bins:
-                break
-            for col in range(top_right_cols):
-                if bins_placed >= num_bins:
-                    break
-                x = reserve_width + col * self.bin_width
-                y = row * self.bin_height
-                if x + self.bin_width <= side_length and y + self.bin_height <= reserve_height:
-                    placements.append((int(x), int(y)))
-                    bins_placed += 1
+        # The column and row counts are floor divisions of each area, so every grid cell fits
+        top_right_count = min(num_bins, max(0, top_right_cols) * max(0, top_right_rows))
+        bottom_count = min(num_bins - top_right_count, max(0, bottom_cols) * max(0, bottom_rows))
+        
+        # Both areas are written into one array, back to back
+        bins_placed = top_right_count + bottom_count
+        placements = np.empty((bins_placed, 2), dtype=np.int32)
         
+        # Area 1: Top-right rectangle
+        self._grid_placements(top_right_count, top_right_cols, reserve_width, 0,
+                              out=placements[:top_right_count])
         # Area 2: Bottom rectangle (full width)
-        for row in range(bottom_rows):
-            if bins_placed >= num_bins:
-                break
-            for col in range(bottom_cols):
-                if bins_placed >= num_bins:
-                    break
-                x = col * self.bin_width
-                y = reserve_height + row * self.bin_height
-                if x + self.bin_width <= side_length and y + self.bin_height <= side_length:
-                    placements.append((int(x), int(y)))
-                    bins_placed += 1
+        self._grid_placements(bottom_count, bottom_cols, 0, reserve_height,
+                              out=placements[top_right_count:])
         
         success = bins_placed >= num_bins
-        return success, placements, (int(reserve_width), reserve_height)
+        return success, placements, (reserve_width, reserve_height)
     
     def _pack_square_with_optimized_reserve(self, num_bins: int, envelope_spec: EnvelopeSpec) -> PackingResult:
         """Pack bins into square with optimized reserved space using binary search."""
         # Binary search for optimal square size
         total_image_area = num_bins * self.bin_width * self.bin_height
+        image_side = math.sqrt(total_image_area)
         
         # Initial bounds
-        side_min = math.sqrt(total_image_area) * 1.0
-        side_max = math.sqrt(total_image_area) * 2.0
+        side_min = image_side * 1.0
+        side_max = image_side * 2.0
         
         # Find working upper bound
-        while side_max <= math.sqrt(total_image_area) * 3.0:
-            success, _, _ = self._try_pack_square_with_optimized_reserve(num_bins, side_max, envelope_spec)
-            if success:
+        side_limit = image_side * 3.0
+        side_step = image_side * 0.2
+        while side_max <= side_limit:
+            if self._square_with_optimized_reserve_fits(num_bins, side_max, envelope_spec):
                 break
-            side_max += math.sqrt(total_image_area) * 0.2
+            side_max += side_step
         
-        # Binary search
-        best_side = side_max
-        best_placements = None
-        best_reserve_dims = None
+        # Binary search on capacity only; placements are built once for the final side
+        best_side = None
         
         while side_max - side_min > 1:
             side_mid = (side_min + side_max) / 2
-            success, placements, reserve_dims = self._try_pack_square_with_optimized_reserve(num_bins, side_mid, envelope_spec)
             
-            if success:
+            if self._square_with_optimized_reserve_fits(num_bins, side_mid, envelope_spec):
                 best_side = side_mid
-                best_placements = placements
-                best_reserve_dims = reserve_dims
                 side_max = side_mid
             else:
                 side_min = side_mid
         
-        if best_placements is None:
+        if best_side is None:
             # Fallback
-            _, best_placements, best_reserve_dims = self._try_pack_square_with_optimized_reserve(num_bins, side_max, envelope_spec)
             best_side = side_max
         
+        _, best_placements, best_reserve_dims = self._try_pack_square_with_optimized_reserve(num_bins, best_side, envelope_spec)
+        
         canvas_size = int(best_side)
         
         # Update envelope spec with optimized dimensions
@@ -399,10 +607,11 @@ class NanoFichePacker:
         envelope_spec.reserve_height = best_reserve_dims[1]
         
         # Calculate grid info for result
-        rows = int(canvas_size / self.bin_height)
-        cols = int(canvas_size / self.bin_width)
+        rows = canvas_size // self.bin_height
+        cols = canvas_size // self.bin_width
         
-        self.logger.info(f"Optimized square: {canvas_size}x{canvas_size}, reserve: {best_reserve_dims[0]}x{best_reserve_dims[1]}")
+        self.logger.info("Optimized square: %dx%d, reserve: %dx%d",
+                         canvas_size, canvas_size, best_reserve_dims[0], best_reserve_dims[1])
         
         return PackingResult(
             rows=rows,
@@ -421,50 +630,41 @@ class NanoFichePacker:
         """Pack bins into rectangle with reserved space."""
         target_aspect = envelope_spec.aspect_x / envelope_spec.aspect_y
         
-        # Start with optimal grid and increase if needed
-        best_rows, best_cols = self._find_optimal_grid(num_bins, target_aspect)
-        found_solution = False
-        scale_factor = 1.0
-        max_scale = 3.0
+        # Start with optimal grid and search for the smallest envelope that also clears the reserve
+        best_rows, _ = self._find_optimal_grid(num_bins, target_aspect)
         
-        while not found_solution and scale_factor <= max_scale:
-            rows = max(best_rows, int(best_rows * scale_factor))
-            cols = max(best_cols, int(best_cols * scale_factor))
-            
-            grid_width = cols * self.bin_width
+        # The reserve can touch at most this many bin rows/columns
+        reserve_rows = -(-envelope_spec.reserve_height // self.bin_height) + 1
+        reserve_cols = -(-envelope_spec.reserve_width // self.bin_width) + 1
+        
+        best = None
+        for rows in range(best_rows, 4 * best_rows):
             grid_height = rows * self.bin_height
+            # The canvas is never shorter than the grid nor narrower than its aspect allows
+            if best is not None and grid_height * int(grid_height * target_aspect) > best[0]:
+                break
             
-            # Adjust to exact aspect ratio
-            if grid_width / grid_height > target_aspect:
-                canvas_width = grid_width
-                canvas_height = int(grid_width / target_aspect)
-            else:
-                canvas_height = grid_height
-                canvas_width = int(grid_height * target_aspect)
-            
-            # Try to place all bins avoiding reserve
-            placements = []
-            offset_x = (canvas_width - grid_width) // 2
-            offset_y = (canvas_height - grid_height) // 2
-            
-            for row in range(rows):
-                for col in range(cols):
-                    if len(placements) >= num_bins:
-                        break
-                    x = offset_x + col * self.bin_width
-                    y = offset_y + row * self.bin_height
-                    
-                    # Check if this position overlaps with reserve
-                    if not self._check_overlap_with_reserve(x, y, envelope_spec, canvas_width, canvas_height):
-                        placements.append((x, y))
-                
-                if len(placements) >= num_bins:
+            # Enough columns to absorb the worst-case loss always fit, so this loop always finds one
+            lost_max = min(reserve_rows, rows) * reserve_cols
+            for cols in range(-(-num_bins // rows), -(-(num_bins + lost_max) // rows) + 1):
+                canvas_width, canvas_height = self._fit_canvas_to_aspect(
+                    cols * self.bin_width, grid_height, target_aspect
+                )
+                lost = self._count_cells_overlapping_reserve(
+                    rows, cols, envelope_spec, canvas_width, canvas_height
+                )
+                if rows * cols - lost >= num_bins:
+                    area = canvas_width * canvas_height
+                    if best is None or area < best[0]:
+                        best = (area, rows, cols, canvas_width, canvas_height)
                     break
-            
-            if len(placements) >= num_bins:
-                found_solution = True
-            else:
-                scale_factor += 0.1  # Increase grid size
+        
+        _, rows, cols, canvas_width, canvas_height = best
+        offset_x = (canvas_width - cols * self.bin_width) // 2
+        offset_y = (canvas_height - rows * self.bin_height) // 2
+        placements = self._grid_placements_avoiding_reserve(
+            num_bins, rows, cols, offset_x, offset_y, envelope_spec, canvas_width, canvas_height
+        )
         
         return PackingResult(
             rows=rows,
@@ -492,26 +692,13 @@ class NanoFichePacker:
         grid_height = best_rows * self.bin_height
         
         # Adjust to exact aspect ratio by scaling the envelope
-        if grid_width / grid_height > target_aspect:
-            # Grid is too wide, adjust height
-            canvas_width = grid_width
-            canvas_height = int(grid_width / target_aspect)
-        else:
-            # Grid is too tall, adjust width
-            canvas_height = grid_height
-            canvas_width = int(grid_height * target_aspect)
+        canvas_width, canvas_height = self._fit_canvas_to_aspect(grid_width, grid_height, target_aspect)
         
         # Generate placements (centered within envelope)
-        placements = []
         offset_x = (canvas_width - grid_width) // 2
         offset_y = (canvas_height - grid_height) // 2
         
-        for i in range(num_bins):
-            row = i // best_cols
-            col = i % best_cols
-            x = offset_x + col * self.bin_width
-            y = offset_y + row * self.bin_height
-            placements.append((x, y))
+        placements = self._grid_placements(num_bins, best_cols, offset_x, offset_y)
         
         return PackingResult(
             rows=best_rows,
@@ -528,41 +715,38 @@ class NanoFichePacker:
     def _pack_circle(self, num_bins: int) -> PackingResult:
         """Pack bins into a circular envelope using circular-constrained grid layout."""
         
-        # Start with an estimate and iteratively find the best fit
         # We want a circle that can fit all bins while maintaining circular shape
         
-        # Calculate area needed and estimate circle size
-        bin_area = self.bin_width * self.bin_height
-        total_area = num_bins * bin_area * 1.5  # Add 50% overhead for circular packing
-        estimated_radius = math.sqrt(total_area / math.pi)
-        
         # Try different grid arrangements to find one that fits in circle
         best_radius = None
         best_grid_size = None
         
-        # Try grid sizes from square down to more elongated rectangles
-        for grid_side in range(math.ceil(math.sqrt(num_bins)), max(1, int(math.sqrt(num_bins) * 0.5)), -1):
-            rows = math.ceil(num_bins / grid_side)
-            cols = grid_side
+        # Try grid sizes from square down to more elongated rectangles, scoring all at once
+        grid_sides = self._circle_grid_side_window(num_bins, _isqrt_ceil(num_bins), max(1, math.isqrt(num_bins) // 2))
+        
+        if grid_sides.size:
+            grid_rows = -(-num_bins // grid_sides)
             
-            # Calculate inscribed rectangle that fits in circle
-            grid_width = cols * self.bin_width
-            grid_height = rows * self.bin_height
+            # Calculate inscribed rectangles that fit in circle
+            grid_widths = grid_sides * self.bin_width
+            grid_heights = grid_rows * self.bin_height
+            
+            # Minimum radius grows with the diagonal, so compare squared diagonals;
+            # argmin keeps the first (largest side) candidate on ties
+            grid_diagonals_sq = grid_widths * grid_widths + grid_heights * grid_heights
+            best = int(np.argmin(grid_diagonals_sq))
+            best_grid_size = (int(grid_rows[best]), int(grid_sides[best]))
             
             # Find minimum radius to fit this grid as inscribed rectangle
             # Use diagonal divided by 2, then add margin
-            grid_diagonal = math.sqrt(grid_width**2 + grid_height**2)
-            required_radius = grid_diagonal / 2 * 1.2  # 20% margin
-            
-            if best_radius is None or required_radius < best_radius:
-                best_radius = required_radius
-                best_grid_size = (rows, cols)
-        
-        if best_grid_size is None:
+            best_radius = math.sqrt(int(grid_diagonals_sq[best])) / 2 * 1.2  # 20% margin
+        else:
             # Fallback to square
-            side = math.ceil(math.sqrt(num_bins))
+            side = _isqrt_ceil(num_bins)
             best_grid_size = (side, side)
-            grid_diagonal = math.sqrt((side * self.bin_width)**2 + (side * self.bin_height)**2)
+            grid_width = side * self.bin_width
+            grid_height = side * self.bin_height
+            grid_diagonal = math.sqrt(grid_width * grid_width + grid_height * grid_height)
             best_radius = grid_diagonal / 2 * 1.2
         
         canvas_size = int(2 * best_radius)
@@ -584,118 +768,199 @@ class NanoFichePacker:
             bin_height=self.bin_height
         )
     
-    def _check_inside_circle_avoiding_reserve(self, x: int, y: int, center_x: float, center_y: float, 
-                                              radius: float, envelope_spec: EnvelopeSpec) -> bool:
-        """Check if a bin position is valid: inside circle but outside reserved space (optimized version)."""
-        # Use tile center for circle check (like original algorithm)
-        tile_center_x = x + self.bin_width // 2
-        tile_center_y = y + self.bin_height // 2
-        distance_from_center = math.sqrt((tile_center_x - center_x)**2 + (tile_center_y - center_y)**2)
+    def _circle_grid_side_window(self, num_bins: int, first_side: int, stop_side: int) -> np.ndarray:
+        """
+        Grid sides from first_side down to (excluding) stop_side that can minimize the grid diagonal.
         
-        if distance_from_center > radius:
-            return False  # Outside circle
+        The squared diagonal for side c is at least (c*bw)² + (N*bh/c)², which is convex in c with its
+        minimum at c* = sqrt(N*bh/bw). Scoring the sides next to c* gives an upper bound, and only the
+        sides whose lower bound does not exceed it can win, so the scan shrinks from O(sqrt N) sides to
+        a short run around c* while keeping the same order and tie-breaking.
+        """
+        if first_side <= stop_side:
+            return np.empty(0, dtype=np.int64)
+        
+        bw_sq = self.bin_width * self.bin_width
+        bh_n = self.bin_height * num_bins
+        bh_n_sq = bh_n * bh_n
+        
+        def grid_diagonal_sq(side):
+            width = side * self.bin_width
+            height = -(-num_bins // side) * self.bin_height
+            return width * width + height * height
+        
+        nearest = math.isqrt(num_bins * self.bin_height // self.bin_width)
+        bound = min(
+            grid_diagonal_sq(side)
+            for side in {min(max(c, stop_side + 1), first_side) for c in (nearest, nearest + 1)}
+        )
         
-        # Check if overlaps with square reserve (always center for circles)
-        if envelope_spec.reserve_enabled:
-            square_half_size = envelope_spec.reserve_width // 2  # Assume square reserve
-            square_left = center_x - square_half_size
-            square_right = center_x + square_half_size
-            square_top = center_y - square_half_size
-            square_bottom = center_y + square_half_size
-            
-            # Tile bounds
-            tile_left = x
-            tile_right = x + self.bin_width
-            tile_top = y
-            tile_bottom = y + self.bin_height
-            
-            # Check if tile overlaps with square reserve
-            if not (tile_right <= square_left or tile_left >= square_right or 
-                   tile_bottom <= square_top or tile_top >= square_bottom):
-                return False  # Overlaps with square reserve
+        # Sides with (c*bw)² + (N*bh/c)² <= bound satisfy bw²t² - bound*t + (N*bh)² <= 0 for t = c²
+        root = math.isqrt(max(0, bound * bound - 4 * bw_sq * bh_n_sq)) + 1
+        low_side = math.isqrt(max(0, (bound - root) // (2 * bw_sq)))
+        high_side = math.isqrt(-(-(bound + root) // (2 * bw_sq))) + 1
         
-        return True
+        return np.arange(min(first_side, high_side), max(stop_side, low_side - 1), -1, dtype=np.int64)
     
-    def _pack_circle_with_reserve_optimized(self, num_bins: int, radius: float, envelope_spec: EnvelopeSpec) -> Tuple[List[Tuple[int, int]], bool]:
-        """Pack images row-by-row in circle with square reserve (optimized algorithm)."""
-        canvas_size = int(2 * radius)
+    def _circle_reserve_bounds(self, canvas_size: int, square_half_size: int) -> Tuple[int, int, int, int, int, int]:
+        """Circle center and the (left, top, right, bottom) edges of the square reserve centered on it."""
         center_x = center_y = canvas_size // 2
+        return (center_x, center_y, center_x - square_half_size, center_y - square_half_size,
+                center_x + square_half_size, center_y + square_half_size)
+    
+    def _circle_reserve_mask(self, canvas_size: int, radius_sq: float, square_half_size: int,
+                             reserve_enabled: bool) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Candidate tile columns and rows inside the disk's bounding square, and the mask of tiles
+        whose center lies in the circle and which do not overlap the square reserve.
+        """
+        center_x, center_y, square_left, square_top, square_right, square_bottom = \
+            self._circle_reserve_bounds(canvas_size, square_half_size)
+        
+        # Candidate bin positions, row by row from top to bottom (like original)
+        xs = np.arange(0, canvas_size - self.bin_width + 1, self.bin_width, dtype=np.int64)
+        ys = np.arange(0, canvas_size - self.bin_height + 1, self.bin_height, dtype=np.int64)
+        
+        # Skip rows and columns that lie entirely outside the disk's bounding square
+        radius = math.sqrt(radius_sq)
+        first_row = max(0, math.floor((center_y - self.bin_height // 2 - radius) / self.bin_height))
+        end_row = math.floor((center_y - self.bin_height // 2 + radius) / self.bin_height) + 2
+        ys = ys[first_row:end_row]
+        first_col = max(0, math.floor((center_x - self.bin_width // 2 - radius) / self.bin_width))
+        end_col = math.floor((center_x - self.bin_width // 2 + radius) / self.bin_width) + 2
+        xs = xs[first_col:end_col]
+        
+        # Use tile center for circle check, comparing squared distances; they are integers,
+        # so comparing against floor(r²) keeps the whole test in integer arithmetic
+        dx = xs + self.bin_width // 2 - center_x
+        dy = ys + self.bin_height // 2 - center_y
+        valid = np.add.outer(dy * dy, dx * dx) <= math.floor(radius_sq)
+        
+        # Exclude tiles that overlap the square reserve; they form one contiguous block of the mask
+        if reserve_enabled:
+            cols_overlap = np.flatnonzero((xs + self.bin_width > square_left) & (xs < square_right))
+            rows_overlap = np.flatnonzero((ys + self.bin_height > square_top) & (ys < square_bottom))
+            if rows_overlap.size and cols_overlap.size:
+                valid[rows_overlap[0]:rows_overlap[-1] + 1, cols_overlap[0]:cols_overlap[-1] + 1] = False
+        
+        return xs, ys, valid
+    
+    def _count_circle_with_reserve_optimized(self, num_bins: int, canvas_size: int, radius_sq: float,
+                                             square_half_size: int, reserve_enabled: bool) -> int:
+        """Number of bins _pack_circle_with_reserve_optimized would place, without building placements."""
+        if NUMBA_AVAILABLE:
+            center_x, center_y, square_left, square_top, square_right, square_bottom = \
+                self._circle_reserve_bounds(canvas_size, square_half_size)
+            return count_circle_reserve(
+                self.bin_width, self.bin_height, center_x, center_y, radius_sq,
+                square_left, square_top, square_right, square_bottom,
+                reserve_enabled, canvas_size, num_bins
+            )
         
-        placements = []
-        images_placed = 0
+        _, _, valid = self._circle_reserve_mask(canvas_size, radius_sq, square_half_size, reserve_enabled)
+        return min(int(np.count_nonzero(valid)), num_bins)
+    
+    def _pack_circle_with_reserve_optimized(self, num_bins: int, canvas_size: int, radius_sq: float,
+                                            square_half_size: int, reserve_enabled: bool) -> Tuple[np.ndarray, bool]:
+        """Pack images row-by-row in circle with square reserve (optimized algorithm)."""
+        if NUMBA_AVAILABLE:
+            center_x, center_y, square_left, square_top, square_right, square_bottom = \
+                self._circle_reserve_bounds(canvas_size, square_half_size)
+            out = np.empty((num_bins, 2), dtype=np.int32)
+            images_placed = sweep_circle_reserve(
+                self.bin_width, self.bin_height, center_x, center_y, radius_sq,
+                square_left, square_top, square_right, square_bottom,
+                reserve_enabled, canvas_size, num_bins, out
+            )
+            return out[:images_placed], images_placed == num_bins
         
-        # Go row by row from top to bottom (like original)
-        current_y = 0
+        xs, ys, valid = self._circle_reserve_mask(canvas_size, radius_sq, square_half_size, reserve_enabled)
         
-        while images_placed < num_bins and current_y + self.bin_height <= canvas_size:
-            # Place images left to right in this row
-            current_x = 0
-            
-            while images_placed < num_bins and current_x + self.bin_width <= canvas_size:
-                # Check if this position is valid
-                if self._check_inside_circle_avoiding_reserve(current_x, current_y, center_x, center_y, radius, envelope_spec):
-                    placements.append((current_x, current_y))
-                    images_placed += 1
-                
-                current_x += self.bin_width
-            
-            current_y += self.bin_height
+        # np.nonzero walks the mask in row-major order (top-to-bottom, left-to-right)
+        row_idx, col_idx = np.nonzero(valid)
+        row_idx = row_idx[:num_bins]
+        col_idx = col_idx[:num_bins]
+        placements = np.stack([xs[col_idx], ys[row_idx]], axis=1).astype(np.int32)
         
         # Check if all images fit
-        all_images_fit = (images_placed == num_bins)
+        all_images_fit = (len(placements) == num_bins)
         return placements, all_images_fit
     
     def _pack_circle_with_reserve(self, num_bins: int, envelope_spec: EnvelopeSpec) -> PackingResult:
         """Pack bins into circle with reserved space using optimized binary search (93.9% efficiency algorithm)."""
         # Step 1: Calculate image area
         image_area = num_bins * self.bin_width * self.bin_height
-        self.logger.info(f"Optimized circle packing: image area = {image_area:,} pixels²")
+        self.logger.info("Optimized circle packing: image area = %d pixels²", image_area)
         
         # Step 2: Start with envelope area same as image area
         # For circle: area = π * r², so r = sqrt(area / π)
-        min_radius = math.sqrt(image_area / math.pi)
-        max_radius = math.sqrt(image_area * 3 / math.pi)  # Up to 3x area
+        min_radius = math.sqrt(image_area * _INV_PI)
+        max_radius = min_radius * _SQRT_3  # Up to 3x area
+        
+        self.logger.info("Binary search bounds: min_radius=%.1f, max_radius=%.1f", min_radius, max_radius)
         
-        self.logger.info(f"Binary search bounds: min_radius={min_radius:.1f}, max_radius={max_radius:.1f}")
+        # The reserve's extent around the center does not depend on the radius
+        square_half_size = envelope_spec.reserve_width // 2  # Assume square reserve
+        reserve_enabled = envelope_spec.reserve_enabled
         
         best_radius = None
-        best_placements = None
         iteration = 0
         
+        # Step 3: Probe just above the radius whose area holds the bins plus the cells the reserve
+        # can block; once everything fits there, larger midpoints need not be packed
+        reserve_area = (2 * square_half_size + self.bin_width) * (2 * square_half_size + self.bin_height) if reserve_enabled else 0
+        probe_radius = math.sqrt((image_area + reserve_area) / math.pi) * 1.02 + max(self.bin_width, self.bin_height) / 2
+        known_fit_radius = math.inf
+        if min_radius < probe_radius < max_radius:
+            probe_count = self._count_circle_with_reserve_optimized(
+                num_bins, int(2 * probe_radius), probe_radius * probe_radius, square_half_size, reserve_enabled
+            )
+            if probe_count >= num_bins:
+                known_fit_radius = probe_radius
+        
         # Binary search loop with sub-pixel precision for maximum optimization
         while max_radius - min_radius > 0.1:
             iteration += 1
             test_radius = (min_radius + max_radius) / 2
-            test_area = math.pi * test_radius * test_radius
             
-            # Pack images and check if any go outside envelope
-            placements, all_fit = self._pack_circle_with_reserve_optimized(num_bins, test_radius, envelope_spec)
+            if test_radius >= known_fit_radius:
+                # At least as large as the probe that fit
+                self.logger.info("Iteration %d: radius=%.1f ✓ above fitting probe", iteration, test_radius)
+                max_radius = test_radius
+                best_radius = test_radius
+                continue
+            
+            # Count the images that fit; placements are built once at the end
+            images_fit = self._count_circle_with_reserve_optimized(
+                num_bins, int(2 * test_radius), test_radius * test_radius, square_half_size, reserve_enabled
+            )
             
-            if all_fit:
+            if images_fit >= num_bins:
                 # If inside then decrease envelope area
-                self.logger.info(f"Iteration {iteration}: radius={test_radius:.1f} ✓ All {len(placements)} images fit")
+                self.logger.info("Iteration %d: radius=%.1f ✓ All %d images fit", iteration, test_radius, images_fit)
                 max_radius = test_radius
                 best_radius = test_radius
-                best_placements = placements
             else:
                 # If outside then increase envelope area
-                self.logger.info(f"Iteration {iteration}: radius={test_radius:.1f} ✗ Only {len(placements)}/{num_bins} fit")
+                self.logger.info("Iteration %d: radius=%.1f ✗ Only %d/%d fit", iteration, test_radius, images_fit, num_bins)
                 min_radius = test_radius
         
         # Use the last working radius
         if best_radius is None:
             best_radius = max_radius
-            best_placements, _ = self._pack_circle_with_reserve_optimized(num_bins, best_radius, envelope_spec)
+        best_placements, _ = self._pack_circle_with_reserve_optimized(
+            num_bins, int(2 * best_radius), best_radius * best_radius, square_half_size, reserve_enabled
+        )
         
         final_canvas_size = int(2 * best_radius)
         final_envelope_area = math.pi * best_radius * best_radius
         efficiency = image_area / final_envelope_area * 100
         
-        self.logger.info(f"Optimized result: radius={best_radius:.1f}, efficiency={efficiency:.1f}%")
+        self.logger.info("Optimized result: radius=%.1f, efficiency=%.1f%%", best_radius, efficiency)
         
         # Calculate grid dimensions for compatibility
-        rows = int(final_canvas_size / self.bin_height)
-        cols = int(final_canvas_size / self.bin_width)
+        rows = final_canvas_size // self.bin_height
+        cols = final_canvas_size // self.bin_width
         
         return PackingResult(
             rows=rows,
@@ -722,8 +987,8 @@ class NanoFichePacker:
         canvas_height = int(2 * best_result['b'])
         
         # Calculate grid info for compatibility
-        rows = int(canvas_height / self.bin_height)
-        cols = int(canvas_width / self.bin_width)
+        rows = canvas_height // self.bin_height
+        cols = canvas_width // self.bin_width
         
         return PackingResult(
             rows=rows,
@@ -737,39 +1002,124 @@ class NanoFichePacker:
             bin_height=self.bin_height
         )
     
-    def _generate_ellipse_raster_fill(self, num_bins: int, a: float, b: float) -> List[Tuple[int, int]]:
-        """Generate ellipse placements using row-by-row raster fill (top-to-bottom, left-to-right)."""
-        placements = []
+    def _ellipse_row_runs(self, ny_sq: np.ndarray, start_x: int, num_cols: int, center_x: int,
+                          a: float, limit: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Column runs [first, end) of a grid starting at start_x whose bin centers satisfy
+        ((x-cx)/a)² + ny² ≤ limit, for rows with the given ny².
         
-        canvas_width = int(2 * a)
-        canvas_height = int(2 * b)
-        center_x = canvas_width // 2
-        center_y = canvas_height // 2
+        In a row the passing columns are one contiguous run around the center, so each run is
+        read off the ellipse's chord and its ends settled with the exact test, instead of testing
+        every cell.
+        """
+        bin_width = self.bin_width
+        offset = start_x + bin_width // 2 - center_x
         
-        # Row-by-row raster fill from top to bottom
-        current_y = 0
+        def inside(col):
+            nx = (col * bin_width + offset) / a
+            return nx * nx + ny_sq <= limit
         
-        while len(placements) < num_bins and current_y + self.bin_height <= canvas_height:
-            # Fill left to right in this row
-            current_x = 0
-            
-            while len(placements) < num_bins and current_x + self.bin_width <= canvas_width:
-                # Check if this bin position is inside the ellipse
-                bin_center_x = current_x + self.bin_width // 2
-                bin_center_y = current_y + self.bin_height // 2
-                
-                # Ellipse equation: ((x-cx)/a)² + ((y-cy)/b)² ≤ 1
-                ellipse_test = ((bin_center_x - center_x) / a) ** 2 + ((bin_center_y - center_y) / b) ** 2
-                
-                if ellipse_test <= 1.0:  # Inside ellipse
-                    placements.append((current_x, current_y))
-                
-                current_x += self.bin_width
-            
-            current_y += self.bin_height
+        # Chord estimate of each run, clipped to the grid
+        half_chord = abs(a) * np.sqrt(np.maximum(0.0, limit - ny_sq))
+        first = np.clip(np.ceil((-offset - half_chord) / bin_width), 0, num_cols).astype(np.int64)
+        end = np.clip(np.floor((half_chord - offset) / bin_width) + 1, 0, num_cols).astype(np.int64)
+        end = np.maximum(end, first)
+        
+        # Settle both ends with the exact test; rounding moves them by at most a column or so
+        while True:
+            grow = (first > 0) & inside(first - 1)
+            if not grow.any():
+                break
+            first -= grow
+        while True:
+            grow = (end < num_cols) & inside(end)
+            if not grow.any():
+                break
+            end += grow
+        while True:
+            shrink = (first < end) & ~inside(first)
+            if not shrink.any():
+                break
+            first += shrink
+        while True:
+            shrink = (first < end) & ~inside(end - 1)
+            if not shrink.any():
+                break
+            end -= shrink
         
+        return first, end
+    
+    def _row_fill_counts(self, num_bins: int, images_per_row: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Mask of the rows a row-by-row fill of num_bins uses, given each row's capacity, and how many
+        bins each of them gets.
+        """
+        # Stop at the row where the running total reaches num_bins, trimming that row to fit
+        placed_before = np.cumsum(images_per_row) - images_per_row
+        used = (images_per_row > 0) & (placed_before < num_bins)
+        return used, np.minimum(images_per_row[used], num_bins - placed_before[used])
+    
+    def _row_run_placements(self, num_bins: int, start_x: int, ys: np.ndarray,
+                            first: np.ndarray, end: np.ndarray) -> np.ndarray:
+        """Fill the column runs row by row, left to right, up to num_bins, as an (N, 2) int32 array."""
+        used, images_in_row = self._row_fill_counts(num_bins, end - first)
+        
+        # Expand rows into bins: each bin's row and its column within that row
+        bin_row = np.repeat(np.arange(len(images_in_row)), images_in_row)
+        bin_col = first[used][bin_row] + np.arange(len(bin_row)) - \
+            np.repeat(np.cumsum(images_in_row) - images_in_row, images_in_row)
+        
+        placements = np.empty((len(bin_row), 2), dtype=np.int32)
+        placements[:, 0] = start_x + bin_col * self.bin_width
+        placements[:, 1] = ys[used][bin_row]
         return placements
     
+    def _ellipse_raster_rows(self, a: float, b: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Row tops and the column runs [first, end) of each row on the ellipse's canvas whose bin
+        centers satisfy the ellipse equation ((x-cx)/a)² + ((y-cy)/b)² ≤ 1.
+        
+        The ellipse search counts and then fills the same size, so the runs of the last ellipse
+        are kept.
+        """
+        cached = self._ellipse_rows
+        if cached is not None and cached[0] == (a, b):
+            return cached[1]
+        
+        canvas_width = int(2 * a)
+        canvas_height = int(2 * b)
+        
+        ys = np.arange(canvas_height // self.bin_height, dtype=np.int64) * self.bin_height
+        ny = (ys + self.bin_height // 2 - canvas_height // 2) / b
+        first, end = self._ellipse_row_runs(ny * ny, 0, canvas_width // self.bin_width, canvas_width // 2, a, 1.0)
+        
+        rows = (ys, first, end)
+        self._ellipse_rows = ((a, b), rows)
+        return rows
+    
+    def _generate_ellipse_raster_fill(self, num_bins: int, a: float, b: float) -> np.ndarray:
+        """
+        Generate ellipse placements using row-by-row raster fill (top-to-bottom, left-to-right),
+        as an (N, 2) int32 array.
+        """
+        if NUMBA_AVAILABLE:
+            # The raster fill is the grid fill over the whole canvas with the full ellipse (limit 1)
+            canvas_width = int(2 * a)
+            canvas_height = int(2 * b)
+            out = np.empty((max(num_bins, 0), 2), dtype=np.int32)
+            bins_placed = fill_ellipse_grid(self.bin_width, self.bin_height,
+                                            canvas_height // self.bin_height, canvas_width // self.bin_width,
+                                            0, 0, canvas_width // 2, canvas_height // 2, a, b, 1.0, num_bins, out)
+            return out[:bins_placed]
+        
+        ys, first, end = self._ellipse_raster_rows(a, b)
+        return self._row_run_placements(num_bins, 0, ys, first, end)
+    
+    def _count_ellipse_raster_capacity(self, a: float, b: float) -> int:
+        """Count how many bins _generate_ellipse_raster_fill could place, from the row runs alone."""
+        _, first, end = self._ellipse_raster_rows(a, b)
+        return int((end - first).sum())
+    
     def _find_optimal_ellipse_with_better_fill(self, num_bins: int, aspect_ratio: float) -> dict:
         """Find optimal ellipse with 100% bottom edge fill, then balance symmetry."""
         
@@ -792,14 +1142,15 @@ class NanoFichePacker:
         placements = initial_result['placements']
         fill_analysis = self._analyze_ellipse_fill_pattern(placements, current_a, current_b)
         
-        self.logger.info(f"Initial fill analysis: {fill_analysis['filled_rows']} rows, last row has {fill_analysis['last_row_count']} images, avg: {fill_analysis['avg_row_count']:.1f}")
+        self.logger.info("Initial fill analysis: %s rows, last row has %s images, avg: %.1f",
+                         fill_analysis['filled_rows'], fill_analysis['last_row_count'], fill_analysis['avg_row_count'])
         
         # If last row has very few images compared to typical rows, try to reduce envelope
         if fill_analysis['last_row_count'] > 0 and fill_analysis['avg_row_count'] > 0:
             fill_ratio = fill_analysis['last_row_count'] / fill_analysis['avg_row_count']
             
             if fill_ratio < 0.8:  # Last row less than 80% filled - more aggressive threshold
-                self.logger.info(f"Last row fill ratio {fill_ratio:.2f} < 0.8, attempting optimization")
+                self.logger.info("Last row fill ratio %.2f < 0.8, attempting optimization", fill_ratio)
                 
                 # Try reducing ellipse size step by step - more aggressive steps
                 reduction_steps = [0.99, 0.97, 0.95, 0.93, 0.91, 0.89, 0.87, 0.85, 0.83, 0.81]
@@ -808,11 +1159,10 @@ class NanoFichePacker:
                     test_a = current_a * reduction_factor
                     test_b = current_b * reduction_factor
                     
-                    test_placements = self._generate_ellipse_raster_fill(num_bins, test_a, test_b)
-                    
-                    if len(test_placements) >= num_bins:
-                        # Check if this improves fill
-                        test_analysis = self._analyze_ellipse_fill_pattern(test_placements[:num_bins], test_a, test_b)
+                    # Capacity alone decides whether this size fits; only fill and analyze sizes that do
+                    if self._count_ellipse_raster_capacity(test_a, test_b) >= num_bins:
+                        # Check if this improves fill, from the row runs; placements are built only when kept
+                        test_analysis = self._raster_fill_pattern(num_bins, test_a, test_b)
                         
                         if test_analysis['last_row_count'] > 0 and test_analysis['avg_row_count'] > 0:
                             test_fill_ratio = test_analysis['last_row_count'] / test_analysis['avg_row_count']
@@ -821,10 +1171,10 @@ class NanoFichePacker:
                             if test_fill_ratio > fill_ratio * 1.05:  # At least 5% improvement
                                 best_result = {
                                     'a': test_a, 'b': test_b, 
-                                    'placements': test_placements[:num_bins]
+                                    'placements': self._generate_ellipse_raster_fill(num_bins, test_a, test_b)
                                 }
                                 fill_ratio = test_fill_ratio
-                                self.logger.info(f"Improved fill ratio to {test_fill_ratio:.2f} with reduction factor {reduction_factor:.2f}")
+                                self.logger.info("Improved fill ratio to %.2f with reduction factor %.2f", test_fill_ratio, reduction_factor)
                             
                             # Also try alternative: if we can eliminate the sparsely filled last row entirely
                             elif test_analysis['filled_rows'] < fill_analysis['filled_rows']:
@@ -833,10 +1183,10 @@ class NanoFichePacker:
                                 if eliminated_last_row_efficiency > 1.02:  # 2% better efficiency
                                     best_result = {
                                         'a': test_a, 'b': test_b, 
-                                        'placements': test_placements[:num_bins]
+                                        'placements': self._generate_ellipse_raster_fill(num_bins, test_a, test_b)
                                     }
                                     fill_ratio = test_fill_ratio
-                                    self.logger.info(f"Eliminated sparse last row, new efficiency: {eliminated_last_row_efficiency:.3f}")
+                                    self.logger.info("Eliminated sparse last row, new efficiency: %.3f", eliminated_last_row_efficiency)
                     else:
                         # This reduction is too aggressive, try a few more smaller reductions
                         minor_reductions = [reduction_factor + 0.01, reduction_factor + 0.005]
@@ -846,25 +1196,23 @@ class NanoFichePacker:
                             if minor_factor < 1.0:
                                 minor_a = current_a * minor_factor
                                 minor_b = current_b * minor_factor
-                                minor_placements = self._generate_ellipse_raster_fill(num_bins, minor_a, minor_b)
-                                
-                                if len(minor_placements) >= num_bins:
-                                    minor_analysis = self._analyze_ellipse_fill_pattern(minor_placements[:num_bins], minor_a, minor_b)
+                                if self._count_ellipse_raster_capacity(minor_a, minor_b) >= num_bins:
+                                    minor_analysis = self._raster_fill_pattern(num_bins, minor_a, minor_b)
                                     if minor_analysis['last_row_count'] > 0 and minor_analysis['avg_row_count'] > 0:
                                         minor_fill_ratio = minor_analysis['last_row_count'] / minor_analysis['avg_row_count']
                                         if minor_fill_ratio > fill_ratio:
                                             best_result = {
                                                 'a': minor_a, 'b': minor_b, 
-                                                'placements': minor_placements[:num_bins]
+                                                'placements': self._generate_ellipse_raster_fill(num_bins, minor_a, minor_b)
                                             }
                                             found_minor_improvement = True
-                                            self.logger.info(f"Found minor improvement with factor {minor_factor:.3f}")
+                                            self.logger.info("Found minor improvement with factor %.3f", minor_factor)
                                             break
                         
                         if not found_minor_improvement:
                             break
         else:
-            self.logger.info(f"Last row fill ratio {fill_ratio:.2f} >= 0.8, no optimization needed")
+            self.logger.info("Last row fill ratio %.2f >= 0.8, no optimization needed", fill_ratio)
         
         return best_result
     
@@ -879,30 +1227,39 @@ class NanoFichePacker:
         
         return new_avg_fill / max(1, old_avg_fill)
     
-    def _analyze_ellipse_fill_pattern(self, placements: List[Tuple[int, int]], a: float, b: float) -> dict:
-        """Analyze the fill pattern of ellipse to understand row distribution."""
+    def _raster_fill_pattern(self, num_bins: int, a: float, b: float) -> dict:
+        """
+        _analyze_ellipse_fill_pattern of _generate_ellipse_raster_fill(num_bins, a, b), read from the
+        raster row runs without building the placements.
+        """
+        _, first, end = self._ellipse_raster_rows(a, b)
+        row_counts = self._row_fill_counts(num_bins, end - first)[1].tolist()
         
-        if not placements:
+        if not row_counts:
             return {'filled_rows': 0, 'last_row_count': 0, 'avg_row_count': 0}
         
-        # Group placements by row
-        rows = {}
-        for x, y in placements:
-            row_index = y // self.bin_height
-            if row_index not in rows:
-                rows[row_index] = 0
-            rows[row_index] += 1
+        return {
+            'filled_rows': len(row_counts),
+            'last_row_count': row_counts[-1],
+            'avg_row_count': sum(row_counts) / len(row_counts),
+            'row_counts': row_counts
+        }
+    
+    def _analyze_ellipse_fill_pattern(self, placements: np.ndarray, a: float, b: float) -> dict:
+        """Analyze the fill pattern of ellipse to understand row distribution."""
         
-        if not rows:
+        if len(placements) == 0:
             return {'filled_rows': 0, 'last_row_count': 0, 'avg_row_count': 0}
         
-        filled_rows = len(rows)
-        row_counts = list(rows.values())
-        avg_row_count = sum(row_counts) / len(row_counts) if row_counts else 0
+        # Group placements by row; occupied rows in top-to-bottom order
+        row_bins = np.bincount(placements[:, 1] // self.bin_height)
+        row_counts = row_bins[row_bins > 0].tolist()
         
-        # Find last row (highest y position)
-        max_row_index = max(rows.keys())
-        last_row_count = rows[max_row_index]
+        filled_rows = len(row_counts)
+        avg_row_count = sum(row_counts) / len(row_counts)
+        
+        # Last row (highest y position)
+        last_row_count = row_counts[-1]
         
         return {
             'filled_rows': filled_rows,
@@ -924,10 +1281,10 @@ class NanoFichePacker:
         center_y = canvas_height // 2
         
         # Simple symmetry check - could be enhanced
-        left_side_count = sum(1 for x, y in placements if x < center_x)
-        right_side_count = sum(1 for x, y in placements if x >= center_x)
+        left_side_count = int(np.count_nonzero(placements[:, 0] < center_x))
+        right_side_count = len(placements) - left_side_count
         
-        self.logger.info(f"Symmetry balance: {left_side_count} left, {right_side_count} right")
+        self.logger.info("Symmetry balance: %s left, %s right", left_side_count, right_side_count)
         
         return result
     
@@ -952,8 +1309,7 @@ class NanoFichePacker:
         while max_scale <= 1.5:
             test_a = working_a * max_scale
             test_b = working_b * max_scale
-            placements = self._generate_ellipse_raster_fill(num_bins, test_a, test_b)
-            if len(placements) >= num_bins:
+            if self._count_ellipse_raster_capacity(test_a, test_b) >= num_bins:
                 break
             max_scale += 0.1
         
@@ -966,20 +1322,21 @@ class NanoFichePacker:
             test_a = working_a * mid_scale
             test_b = working_b * mid_scale
             
-            placements = self._generate_ellipse_raster_fill(num_bins, test_a, test_b)
-            
-            if len(placements) >= num_bins:
+            # Only sizes that can hold every bin; the bottom row is read from the same row runs
+            # as the capacity, and placements are built only for a new best size
+            if self._count_ellipse_raster_capacity(test_a, test_b) >= num_bins:
                 # Calculate efficiency
                 canvas_area = math.pi * test_a * test_b
                 efficiency = image_area / canvas_area
                 
-                bottom_fill_ratio = self._calculate_bottom_row_fill_ratio(placements[:num_bins], test_a, test_b)
+                bottom_fill_ratio = self._raster_fill_bottom_row_ratio(num_bins, test_a, test_b)
                 
                 if bottom_fill_ratio >= 0.7:  # Good bottom fill
                     if efficiency > best_efficiency:
-                        best_result = {'a': test_a, 'b': test_b, 'placements': placements[:num_bins]}
+                        placements = self._generate_ellipse_raster_fill(num_bins, test_a, test_b)
+                        best_result = {'a': test_a, 'b': test_b, 'placements': placements}
                         best_efficiency = efficiency
-                        self.logger.info(f"Better solution: bottom_fill={bottom_fill_ratio:.2f}, efficiency={efficiency:.1%}")
+                        self.logger.info("Better solution: bottom_fill=%.2f, efficiency=%.1f%%", bottom_fill_ratio, efficiency * 100)
                     max_scale = mid_scale  # Try smaller
                 else:
                     max_scale = mid_scale  # Try smaller to improve bottom fill
@@ -994,12 +1351,32 @@ class NanoFichePacker:
         
         return best_result
     
-    def _calculate_bottom_row_fill_ratio(self, placements: List[Tuple[int, int]], a: float, b: float) -> float:
-        """Calculate fill ratio of the theoretical bottom row (row_env) of ellipse."""
-        
-        if not placements:
+    def _raster_fill_bottom_row_ratio(self, num_bins: int, a: float, b: float) -> float:
+        """
+        Bottom row fill ratio of _generate_ellipse_raster_fill(num_bins, a, b), read from the
+        raster row runs without building the placements.
+        """
+        if num_bins <= 0:
             return 0.0
         
+        # The fill stops in the first row where the running total reaches num_bins
+        ys, first, end = self._ellipse_raster_rows(a, b)
+        placed = np.cumsum(end - first)
+        last_row = int(np.searchsorted(placed, num_bins))
+        if last_row == len(placed):
+            # Not every bin fits; the fill ends in the last row that holds any
+            last_row = int(np.flatnonzero(end > first)[-1]) if placed.size and placed[-1] > 0 else -1
+            if last_row < 0:
+                return 0.0
+            bottom_row_images = int(end[last_row] - first[last_row])
+        else:
+            bottom_row_images = num_bins - int(placed[last_row] - (end[last_row] - first[last_row]))
+        
+        return self._bottom_row_fill_ratio(int(ys[last_row]), bottom_row_images, a, b)
+    
+    def _bottom_row_fill_ratio(self, row_image_y: int, bottom_row_images: int, a: float, b: float) -> float:
+        """Fill ratio of the theoretical bottom row (row_env) given the lowest occupied row and its image count."""
+        
         # Find the actual lowest row that can fit in the ellipse (row_env)
         canvas_height = int(2 * b)
         center_x = a
@@ -1007,8 +1384,10 @@ class NanoFichePacker:
         
         # Find the lowest Y position where a bin can fit within ellipse
         row_env_y = None
-        for test_y in range(canvas_height - self.bin_height, -1, -self.bin_height):
-            bin_center_y = test_y + self.bin_height // 2
+        bin_height = self.bin_height
+        half_height = bin_height // 2
+        for test_y in range(canvas_height - bin_height, -1, -bin_height):
+            bin_center_y = test_y + half_height
             y_normalized = (bin_center_y - center_y) / b
             
             if abs(y_normalized) < 1.0:  # This row can fit in ellipse
@@ -1018,27 +1397,22 @@ class NanoFichePacker:
         if row_env_y is None:
             return 0.0  # No valid bottom row found
         
-        # row_image: Find actual bottom row where images are placed
-        row_image_y = max(y for x, y in placements)
-        
         # Check if images reach the theoretical bottom row
         row_distance = abs(row_image_y - row_env_y)
-        if row_distance > self.bin_height:
+        if row_distance > bin_height:
             # Images don't reach envelope bottom
-            self.logger.info(f"Images don't reach bottom: row_image_y={row_image_y}, row_env_y={row_env_y}, distance={row_distance}")
+            self.logger.info("Images don't reach bottom: row_image_y=%s, row_env_y=%s, distance=%s",
+                             row_image_y, row_env_y, row_distance)
             return 0.0
         
-        # Count images in the actual bottom row
-        bottom_row_images = sum(1 for x, y in placements if y >= row_image_y)
-        
         # Calculate theoretical capacity of row_env using ellipse equation
-        row_env_center_y = row_env_y + self.bin_height // 2
+        row_env_center_y = row_env_y + half_height
         y_normalized = (row_env_center_y - center_y) / b
         
         if abs(y_normalized) >= 1.0:
             theoretical_capacity = 0
         else:
-            x_half_width = a * math.sqrt(1 - y_normalized**2)
+            x_half_width = a * math.sqrt(1 - y_normalized * y_normalized)
             row_width = 2 * x_half_width
             theoretical_capacity = int(row_width / self.bin_width)
         
@@ -1048,8 +1422,8 @@ class NanoFichePacker:
         # Fill ratio = actual images in bottom row / theoretical capacity at envelope bottom
         fill_ratio = bottom_row_images / theoretical_capacity
         
-        self.logger.info(f"Bottom fill: row_image_y={row_image_y}, row_env_y={row_env_y}, "
-                        f"distance={row_distance}, images={bottom_row_images}, capacity={theoretical_capacity}, ratio={fill_ratio:.2f}")
+        self.logger.info("Bottom fill: row_image_y=%s, row_env_y=%s, distance=%s, images=%s, capacity=%s, ratio=%.2f",
+                         row_image_y, row_env_y, row_distance, bottom_row_images, theoretical_capacity, fill_ratio)
         
         return min(1.0, fill_ratio)
     
@@ -1063,117 +1437,39 @@ class NanoFichePacker:
         canvas_width = int(2 * result['a'])
         center_x = canvas_width // 2
         
-        left_side = sum(1 for x, y in placements if x + self.bin_width // 2 < center_x)
-        right_side = sum(1 for x, y in placements if x + self.bin_width // 2 >= center_x)
+        left_side = int(np.count_nonzero(placements[:, 0] + self.bin_width // 2 < center_x))
+        right_side = len(placements) - left_side
         
-        self.logger.info(f"Symmetry with bottom fill: {left_side} left, {right_side} right")
+        self.logger.info("Symmetry with bottom fill: %s left, %s right", left_side, right_side)
         
         return result
     
     def _find_optimal_grid(self, num_bins: int, target_aspect: float) -> Tuple[int, int]:
         """Find optimal rows/columns for rectangular packing."""
-        best_score = float('inf')
-        best_rows = best_cols = 1
-        
-        # Test all possible factorizations
-        for rows in range(1, num_bins + 1):
-            if num_bins % rows == 0:
-                cols = num_bins // rows
-            else:
-                cols = math.ceil(num_bins / rows)
-            
-            # Calculate grid dimensions
-            grid_width = cols * self.bin_width
-            grid_height = rows * self.bin_height
-            grid_aspect = grid_width / grid_height
-            
-            # Score based on how close to target aspect ratio
-            aspect_error = abs(grid_aspect - target_aspect)
-            area = grid_width * grid_height
-            
-            # Combine aspect error and area (prefer smaller area)
-            score = aspect_error + (area / 1000000)  # Normalize area
-            
-            if score < best_score:
-                best_score = score
-                best_rows = rows
-                best_cols = cols
-        
-        return best_rows, best_cols
+        return _optimal_grid(num_bins, target_aspect, self.bin_width, self.bin_height)
     
-    def _generate_spiral_placements(self, num_bins: int, center_x: int, center_y: int, radius: float) -> List[Tuple[int, int]]:
-        """Generate spiral placement pattern for circular envelope."""
-        placements = []
+    def _generate_spiral_placements(self, num_bins: int, center_x: int, center_y: int, radius: float) -> np.ndarray:
+        """Generate spiral placement pattern for circular envelope, as an (N, 2) int32 array."""
+        if num_bins <= 0:
+            return np.empty((0, 2), dtype=np.int32)
         
         # Start from center and spiral outward
-        for i in range(num_bins):
-            # Calculate spiral position
-            angle = i * 0.5  # Adjust for tighter/looser spiral
-            r = (i / num_bins) * radius * 0.8  # Don't use full radius
-            
-            x = center_x + int(r * math.cos(angle)) - self.bin_width // 2
-            y = center_y + int(r * math.sin(angle)) - self.bin_height // 2
-            
-            # Ensure within bounds
-            x = max(0, min(x, center_x * 2 - self.bin_width))
-            y = max(0, min(y, center_y * 2 - self.bin_height))
-            
-            placements.append((x, y))
-        
-        return placements
-    
-    def _generate_elliptical_constrained_placements(self, num_bins: int, rows: int, cols: int,
-                                                  center_x: int, center_y: int, a: float, b: float) -> List[Tuple[int, int]]:
-        """Generate elliptical placement that only places bins within ellipse boundary."""
-        placements = []
-        
-        # Calculate grid dimensions
-        grid_width = cols * self.bin_width
-        grid_height = rows * self.bin_height
-        
-        # Center the grid
-        start_x = center_x - grid_width // 2
-        start_y = center_y - grid_height // 2
-        
-        bins_placed = 0
+        i = np.arange(num_bins)
+        angles = i * 0.5  # Adjust for tighter/looser spiral
+        r = (i / num_bins) * radius * 0.8  # Don't use full radius
         
-        # Place bins row by row, but only if they fit in ellipse
-        for row in range(rows):
-            if bins_placed >= num_bins:
-                break
-                
-            for col in range(cols):
-                if bins_placed >= num_bins:
-                    break
-                
-                # Calculate bin position
-                x = start_x + col * self.bin_width
-                y = start_y + row * self.bin_height
-                
-                # Calculate bin center
-                bin_center_x = x + self.bin_width // 2
-                bin_center_y = y + self.bin_height // 2
-                
-                # Check if bin center is within ellipse
-                # Ellipse equation: ((x-cx)/a)² + ((y-cy)/b)² ≤ 1
-                ellipse_test = ((bin_center_x - center_x) / a) ** 2 + ((bin_center_y - center_y) / b) ** 2
-                
-                if ellipse_test <= 0.8:  # Use 80% of ellipse for better fit
-                    placements.append((x, y))
-                    bins_placed += 1
+        xs = center_x + (r * np.cos(angles)).astype(np.int64) - self.bin_width // 2
+        ys = center_y + (r * np.sin(angles)).astype(np.int64) - self.bin_height // 2
         
-        # If we haven't placed all bins, place remaining ones in spiral within ellipse
-        if bins_placed < num_bins:
-            remaining_placements = self._generate_spiral_placements_elliptical(
-                num_bins - bins_placed, center_x, center_y, a * 0.7, b * 0.7, start_index=bins_placed
-            )
-            placements.extend(remaining_placements)
+        # Ensure within bounds
+        placements = np.empty((num_bins, 2), dtype=np.int32)
+        placements[:, 0] = np.maximum(0, np.minimum(xs, center_x * 2 - self.bin_width))
+        placements[:, 1] = np.maximum(0, np.minimum(ys, center_y * 2 - self.bin_height))
         
         return placements
     
-    def _generate_elliptical_placements(self, num_bins: int, center_x: int, center_y: int, a: float, b: float) -> List[Tuple[int, int]]:
-        """Generate placement pattern for elliptical envelope with simple grid layout."""
-        placements = []
+    def _generate_elliptical_placements(self, num_bins: int, center_x: int, center_y: int, a: float, b: float) -> np.ndarray:
+        """Generate placement pattern for elliptical envelope with simple grid layout, as an (N, 2) int32 array."""
         
         # Use simple rectangular grid that fits within the ellipse, similar to rectangle packing
         # Calculate optimal grid arrangement first
@@ -1189,143 +1485,39 @@ class NanoFichePacker:
         start_y = center_y - grid_height // 2
         
         # Place bins in simple grid pattern (left-to-right, top-to-bottom)
-        for i in range(num_bins):
-            row = i // best_cols
-            col = i % best_cols
-            
-            x = start_x + col * self.bin_width
-            y = start_y + row * self.bin_height
-            
-            # Ensure within canvas bounds
-            x = max(0, min(x, center_x * 2 - self.bin_width))
-            y = max(0, min(y, center_y * 2 - self.bin_height))
-            
-            placements.append((x, y))
-        
-        return placements
-    
-    def _generate_elliptical_constrained_placements(self, num_bins: int, rows: int, cols: int,
-                                                  center_x: int, center_y: int, a: float, b: float) -> List[Tuple[int, int]]:
-        """Generate elliptical placement that only places bins within ellipse boundary."""
-        placements = []
-        
-        # Calculate grid dimensions
-        grid_width = cols * self.bin_width
-        grid_height = rows * self.bin_height
-        
-        # Center the grid
-        start_x = center_x - grid_width // 2
-        start_y = center_y - grid_height // 2
-        
-        bins_placed = 0
-        
-        # Place bins row by row, but only if they fit in ellipse
-        for row in range(rows):
-            if bins_placed >= num_bins:
-                break
-                
-            for col in range(cols):
-                if bins_placed >= num_bins:
-                    break
-                
-                # Calculate bin position
-                x = start_x + col * self.bin_width
-                y = start_y + row * self.bin_height
-                
-                # Calculate bin center
-                bin_center_x = x + self.bin_width // 2
-                bin_center_y = y + self.bin_height // 2
-                
-                # Check if bin center is within ellipse
-                # Ellipse equation: ((x-cx)/a)² + ((y-cy)/b)² ≤ 1
-                ellipse_test = ((bin_center_x - center_x) / a) ** 2 + ((bin_center_y - center_y) / b) ** 2
-                
-                if ellipse_test <= 0.8:  # Use 80% of ellipse for better fit
-                    placements.append((x, y))
-                    bins_placed += 1
+        row, col = np.divmod(np.arange(num_bins, dtype=np.int64), best_cols)
         
-        # If we haven't placed all bins, place remaining ones in spiral within ellipse
-        if bins_placed < num_bins:
-            remaining_placements = self._generate_spiral_placements_elliptical(
-                num_bins - bins_placed, center_x, center_y, a * 0.7, b * 0.7, start_index=bins_placed
-            )
-            placements.extend(remaining_placements)
+        # Ensure within canvas bounds
+        placements = np.empty((num_bins, 2), dtype=np.int32)
+        placements[:, 0] = np.maximum(0, np.minimum(start_x + col * self.bin_width, center_x * 2 - self.bin_width))
+        placements[:, 1] = np.maximum(0, np.minimum(start_y + row * self.bin_height, center_y * 2 - self.bin_height))
         
         return placements
     
     def _generate_spiral_placements_elliptical(self, num_bins: int, center_x: int, center_y: int, 
-                                             a: float, b: float, start_index: int = 0) -> List[Tuple[int, int]]:
-        """Generate spiral placement pattern for remaining bins in elliptical envelope."""
-        placements = []
-        
-        for i in range(num_bins):
-            # Use spiral pattern similar to circle but with elliptical scaling
-            angle = (start_index + i) * 0.5
-            r = ((start_index + i) / (start_index + num_bins)) * 0.8
-            
-            # Convert to elliptical coordinates
-            x = center_x + int(r * a * math.cos(angle)) - self.bin_width // 2
-            y = center_y + int(r * b * math.sin(angle)) - self.bin_height // 2
-            
-            # Ensure within bounds
-            x = max(0, min(x, center_x * 2 - self.bin_width))
-            y = max(0, min(y, center_y * 2 - self.bin_height))
-            
-            placements.append((x, y))
-        
-        return placements
-    
-    def _generate_elliptical_constrained_placements(self, num_bins: int, rows: int, cols: int,
-                                                  center_x: int, center_y: int, a: float, b: float) -> List[Tuple[int, int]]:
-        """Generate elliptical placement that only places bins within ellipse boundary."""
-        placements = []
-        
-        # Calculate grid dimensions
-        grid_width = cols * self.bin_width
-        grid_height = rows * self.bin_height
+                                             a: float, b: float, start_index: int = 0) -> np.ndarray:
+        """Generate spiral placement pattern for remaining bins in elliptical envelope, as an (N, 2) int32 array."""
+        if num_bins <= 0:
+            return np.empty((0, 2), dtype=np.int32)
         
-        # Center the grid
-        start_x = center_x - grid_width // 2
-        start_y = center_y - grid_height // 2
+        # Use spiral pattern similar to circle but with elliptical scaling
+        i = np.arange(start_index, start_index + num_bins)
+        angles = i * 0.5
+        r = (i / (start_index + num_bins)) * 0.8
         
-        bins_placed = 0
-        
-        # Place bins row by row, but only if they fit in ellipse
-        for row in range(rows):
-            if bins_placed >= num_bins:
-                break
-                
-            for col in range(cols):
-                if bins_placed >= num_bins:
-                    break
-                
-                # Calculate bin position
-                x = start_x + col * self.bin_width
-                y = start_y + row * self.bin_height
-                
-                # Calculate bin center
-                bin_center_x = x + self.bin_width // 2
-                bin_center_y = y + self.bin_height // 2
-                
-                # Check if bin center is within ellipse
-                # Ellipse equation: ((x-cx)/a)² + ((y-cy)/b)² ≤ 1
-                ellipse_test = ((bin_center_x - center_x) / a) ** 2 + ((bin_center_y - center_y) / b) ** 2
-                
-                if ellipse_test <= 0.8:  # Use 80% of ellipse for better fit
-                    placements.append((x, y))
-                    bins_placed += 1
+        # Convert to elliptical coordinates
+        xs = center_x + (r * a * np.cos(angles)).astype(np.int64) - self.bin_width // 2
+        ys = center_y + (r * b * np.sin(angles)).astype(np.int64) - self.bin_height // 2
         
-        # If we haven't placed all bins, place remaining ones in spiral within ellipse
-        if bins_placed < num_bins:
-            remaining_placements = self._generate_spiral_placements_elliptical(
-                num_bins - bins_placed, center_x, center_y, a * 0.7, b * 0.7, start_index=bins_placed
-            )
-            placements.extend(remaining_placements)
+        # Ensure within bounds
+        placements = np.empty((num_bins, 2), dtype=np.int32)
+        placements[:, 0] = np.maximum(0, np.minimum(xs, center_x * 2 - self.bin_width))
+        placements[:, 1] = np.maximum(0, np.minimum(ys, center_y * 2 - self.bin_height))
         
         return placements
     
     def _generate_circular_grid_placements(self, num_bins: int, rows: int, cols: int, 
-                                         center_x: int, center_y: int) -> List[Tuple[int, int]]:
+                                         center_x: int, center_y: int) -> np.ndarray:
         """Generate circular layout using row-by-row approach optimized for minimal envelope area."""
         
         # Calculate theoretical minimum radius for perfect circle packing
@@ -1336,54 +1528,53 @@ class NanoFichePacker:
         # Find absolute minimum radius by iterative reduction
         canvas_radius = center_x
         
-        # Start with theoretical minimum and incrementally increase until all images fit
+        # Start with theoretical minimum and grow geometrically until all images fit
         current_radius = theoretical_radius
-        radius_step = 50  # Start with 50-pixel steps
+        failed_radius = theoretical_radius
+        radius_growth = 1.25
         
         best_placements = None
         best_radius = None
         
-        # First, find a working radius
-        max_attempts = 100
+        # First, find a working radius; capacity never grows if no row fits the canvas, so cap the attempts
+        max_attempts = 40
         attempts = 0
         
-        while best_placements is None and attempts < max_attempts:
-            test_placements = self._generate_circular_row_placements(
-                num_bins, current_radius, center_x, center_y
-            )
-            
-            if len(test_placements) == num_bins:
-                best_placements = test_placements
+        while best_radius is None and attempts < max_attempts:
+            if self._count_circle_capacity(current_radius, center_x, center_y) >= num_bins:
                 best_radius = current_radius
                 break
             else:
-                current_radius += radius_step
+                failed_radius = current_radius
+                current_radius *= radius_growth
                 attempts += 1
         
-        # Now that we have a working radius, refine it downward
+        # Now that we have a working radius, refine it downward (capacity only, no placements)
         if best_radius is not None:
-            # Binary search for the minimum working radius
-            min_radius = theoretical_radius
+            # Binary search for the minimum working radius; row capacity only grows with the radius,
+            # so the last radius that failed is a valid lower bound
+            min_radius = failed_radius
             max_radius = best_radius
             
             while max_radius - min_radius > 0.1:
                 test_radius = (min_radius + max_radius) / 2
-                test_placements = self._generate_circular_row_placements(
-                    num_bins, test_radius, center_x, center_y
-                )
                 
-                if len(test_placements) == num_bins:
+                if self._count_circle_capacity(test_radius, center_x, center_y) >= num_bins:
                     # This radius works, try smaller
                     max_radius = test_radius
                     best_radius = test_radius
-                    best_placements = test_placements
                 else:
                     # This radius too small, increase minimum
                     min_radius = test_radius
+            
+            # Materialize placements once, for the smallest working radius
+            best_placements = self._generate_circular_row_placements(
+                num_bins, best_radius, center_x, center_y
+            )
         
         # Calculate final envelope ratio
         if best_radius is not None:
-            envelope_area = math.pi * best_radius ** 2
+            envelope_area = math.pi * best_radius * best_radius
             best_envelope_ratio = envelope_area / total_area
         
         # If no optimal solution found, use fallback with very tight packing
@@ -1393,80 +1584,72 @@ class NanoFichePacker:
             best_placements = self._generate_circular_row_placements(
                 num_bins, working_radius, center_x, center_y
             )
-            envelope_area = math.pi * working_radius ** 2
+            envelope_area = math.pi * working_radius * working_radius
             best_envelope_ratio = envelope_area / total_area
             best_radius = working_radius
         
-        self.logger.info(f"Circular packing: envelope_ratio={best_envelope_ratio:.2f}, "
-                        f"working_radius={best_radius:.1f}")
+        self.logger.info("Circular packing: envelope_ratio=%.2f, working_radius=%.1f",
+                         best_envelope_ratio, best_radius)
         
         return best_placements
     
+    def _circular_row_offsets(self, canvas_size: int, center_y: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Row tops of the circular row layout and each row center's squared offset from center_y."""
+        key = (canvas_size, center_y)
+        cached = self._circular_rows
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        
+        row_tops = np.arange(0, canvas_size - self.bin_height + 1, self.bin_height, dtype=np.int64)
+        y_offset = row_tops + self.bin_height // 2 - center_y
+        rows = (row_tops, y_offset * y_offset)
+        self._circular_rows = (key, rows)
+        return rows
+    
+    def _circular_row_counts(self, working_radius: float, center_x: int, center_y: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Row tops and how many bins fit in each row of the circle at this radius."""
+        row_tops, y_offset_sq = self._circular_row_offsets(center_x * 2, center_y)
+        
+        # Rows whose center lies strictly inside the circle; the chord width is 2*sqrt(r² - dy²)
+        radius_sq = working_radius * working_radius
+        images_per_row = np.zeros(len(row_tops), dtype=np.int64)
+        inside = y_offset_sq < radius_sq
+        row_width = (2 * np.sqrt(radius_sq - y_offset_sq[inside])).astype(np.int64)
+        images_per_row[inside] = row_width // self.bin_width
+        return row_tops, images_per_row
+    
+    def _count_circle_capacity(self, working_radius: float, center_x: int, center_y: int) -> int:
+        """Count how many bins _generate_circular_row_placements can fit at this radius, without placing them."""
+        _, images_per_row = self._circular_row_counts(working_radius, center_x, center_y)
+        return int(images_per_row.sum())
+    
     def _generate_circular_row_placements(self, num_bins: int, working_radius: float,
-                                        center_x: int, center_y: int) -> List[Tuple[int, int]]:
-        """Generate row-by-row circular placement for given radius."""
-        
-        placements = []
-        images_placed = 0
+                                        center_x: int, center_y: int) -> np.ndarray:
+        """Generate row-by-row circular placement for given radius, as an (N, 2) int32 array."""
         
-        # Go row by row from top to bottom
         canvas_size = center_x * 2
-        current_y = 0
+        row_tops, images_per_row = self._circular_row_counts(working_radius, center_x, center_y)
+        used, images_in_row = self._row_fill_counts(num_bins, images_per_row)
         
-        while images_placed < num_bins and current_y + self.bin_height <= canvas_size:
-            # Calculate row center Y position
-            row_center_y = current_y + self.bin_height // 2
-            
-            # Calculate distance from canvas center
-            y_offset_from_center = abs(row_center_y - center_y)
-            
-            # Check if this row intersects the working circle
-            if y_offset_from_center <= working_radius:
-                # Calculate circle width at this Y position using circle equation
-                if y_offset_from_center < working_radius:
-                    x_half_width = math.sqrt(working_radius**2 - y_offset_from_center**2)
-                    row_width = int(2 * x_half_width)
-                    
-                    # Calculate how many images fit in this row with maximum packing
-                    # Use 100% of theoretical capacity for tightest fit
-                    theoretical_images = row_width / self.bin_width
-                    images_in_row = max(0, int(theoretical_images * 1.0))
-                    
-                    # Don't exceed remaining images
-                    images_in_row = min(images_in_row, num_bins - images_placed)
-                    
-                    if images_in_row > 0:
-                        # Center the row within the available width
-                        actual_row_width = images_in_row * self.bin_width
-                        row_start_x = center_x - actual_row_width // 2
-                        
-                        # Place images in this row (left to right)
-                        for col in range(images_in_row):
-                            x = row_start_x + col * self.bin_width
-                            
-                            # Ensure within canvas bounds
-                            x = max(0, min(x, canvas_size - self.bin_width))
-                            y = max(0, min(current_y, canvas_size - self.bin_height))
-                            
-                            placements.append((x, y))
-                            images_placed += 1
-                            
-                            if images_placed >= num_bins:
-                                break
-            
-            current_y += self.bin_height
-            
-            # Safety break
-            if current_y > canvas_size:
-                break
+        # Center each row within the available width
+        row_start_x = center_x - (images_in_row * self.bin_width) // 2
+        
+        # Expand rows into bins: each bin's row and its column within that row
+        bin_row = np.repeat(np.arange(len(images_in_row)), images_in_row)
+        bin_col = np.arange(len(bin_row)) - np.repeat(np.cumsum(images_in_row) - images_in_row, images_in_row)
+        
+        placements = np.empty((len(bin_row), 2), dtype=np.int32)
+        
+        # Ensure within canvas bounds
+        placements[:, 0] = np.maximum(0, np.minimum(row_start_x[bin_row] + bin_col * self.bin_width,
+                                                     canvas_size - self.bin_width))
+        placements[:, 1] = np.maximum(0, np.minimum(row_tops[used][bin_row], canvas_size - self.bin_height))
         
         return placements
     
     def _generate_elliptical_constrained_placements(self, num_bins: int, rows: int, cols: int,
-                                                  center_x: int, center_y: int, a: float, b: float) -> List[Tuple[int, int]]:
-        """Generate elliptical placement that only places bins within ellipse boundary."""
-        placements = []
-        
+                                                  center_x: int, center_y: int, a: float, b: float) -> np.ndarray:
+        """Generate elliptical placement that only places bins within ellipse boundary, as an (N, 2) int32 array."""
         # Calculate grid dimensions
         grid_width = cols * self.bin_width
         grid_height = rows * self.bin_height
@@ -1475,41 +1658,36 @@ class NanoFichePacker:
         start_x = center_x - grid_width // 2
         start_y = center_y - grid_height // 2
         
-        bins_placed = 0
+        # Ellipse equation: ((x-cx)/a)² + ((y-cy)/b)² ≤ 1
+        ellipse_limit = 0.8  # Use 80% of ellipse for better fit
         
-        # Place bins row by row, but only if they fit in ellipse
-        for row in range(rows):
-            if bins_placed >= num_bins:
-                break
-                
-            for col in range(cols):
-                if bins_placed >= num_bins:
-                    break
-                
-                # Calculate bin position
-                x = start_x + col * self.bin_width
-                y = start_y + row * self.bin_height
-                
-                # Calculate bin center
-                bin_center_x = x + self.bin_width // 2
-                bin_center_y = y + self.bin_height // 2
-                
-                # Check if bin center is within ellipse
-                # Ellipse equation: ((x-cx)/a)² + ((y-cy)/b)² ≤ 1
-                ellipse_test = ((bin_center_x - center_x) / a) ** 2 + ((bin_center_y - center_y) / b) ** 2
-                
-                if ellipse_test <= 0.8:  # Use 80% of ellipse for better fit
-                    placements.append((x, y))
-                    bins_placed += 1
+        if NUMBA_AVAILABLE:
+            out = np.empty((max(num_bins, 0), 2), dtype=np.int32)
+            bins_placed = fill_ellipse_grid(self.bin_width, self.bin_height, rows, cols, start_x, start_y,
+                                            center_x, center_y, a, b, ellipse_limit, num_bins, out)
+            placements = out[:bins_placed]
+        else:
+            # Only the rows whose bin centers can reach the ellipse; the row runs trim the rest
+            y_reach = abs(b) * math.sqrt(ellipse_limit)
+            first_row = max(0, math.floor((center_y - y_reach - start_y - self.bin_height // 2) / self.bin_height))
+            end_row = min(rows, math.floor((center_y + y_reach - start_y - self.bin_height // 2) / self.bin_height) + 2)
+            ys = start_y + np.arange(first_row, max(first_row, end_row), dtype=np.int64) * self.bin_height
+            
+            # Each row's run of bin centers within the ellipse, filled row by row
+            ny = (ys + self.bin_height // 2 - center_y) / b
+            first, end = self._ellipse_row_runs(ny * ny, start_x, cols, center_x, a, ellipse_limit)
+            placements = self._row_run_placements(num_bins, start_x, ys, first, end)
+            bins_placed = len(placements)
         
         # If we haven't placed all bins, place remaining ones in spiral within ellipse
         if bins_placed < num_bins:
             remaining_placements = self._generate_spiral_placements_elliptical(
                 num_bins - bins_placed, center_x, center_y, a * 0.7, b * 0.7, start_index=bins_placed
             )
-            placements.extend(remaining_placements)
+            placements = np.concatenate([placements, remaining_placements])
         
-        return placements    
+        return placements
+    
     def _pack_circle_with_binary_search(self, num_bins: int, square_reserve_size: int = 10000) -> PackingResult:
         """
         Pack bins into circle with square reserve using binary envelope search algorithm.
@@ -1525,58 +1703,57 @@ class NanoFichePacker:
         
         # Step 1: Calculate image area
         image_area = num_bins * self.bin_width * self.bin_height
-        self.logger.info(f"Binary search: Image area = {image_area:,} pixels²")
+        self.logger.info("Binary search: Image area = %d pixels²", image_area)
         
         # Step 2: Start with envelope area same as image area
         # For circle: area = π * r², so r = sqrt(area / π)
-        min_radius = math.sqrt(image_area / math.pi)
+        min_radius = math.sqrt(image_area * _INV_PI)
         
         # Set search bounds - max radius includes overhead for inefficiency
-        max_radius = math.sqrt(image_area * 3 / math.pi)  # Up to 3x area
+        max_radius = min_radius * _SQRT_3  # Up to 3x area
         
-        self.logger.info(f"Binary search: min_radius={min_radius:.1f}, max_radius={max_radius:.1f}")
+        self.logger.info("Binary search: min_radius=%.1f, max_radius=%.1f", min_radius, max_radius)
         
         best_radius = None
-        best_placements = None
         iteration = 0
         
         # Binary search loop
         while max_radius - min_radius > 0.1:  # Sub-pixel precision for maximum optimization
             iteration += 1
             test_radius = (min_radius + max_radius) / 2
-            test_area = math.pi * test_radius * test_radius
             
-            self.logger.info(f"Binary search iteration {iteration}: radius={test_radius:.1f}, area={test_area:,.0f}")
+            if self.logger.isEnabledFor(logging.INFO):
+                test_area = math.pi * test_radius * test_radius
+                self.logger.info("Binary search iteration %d: radius=%.1f, area=%.0f", iteration, test_radius, test_area)
             
-            # Step 3: Place images and check if any go outside envelope
-            placements, all_fit = self._pack_images_in_circle_with_reserve(num_bins, test_radius, square_reserve_size)
+            # Step 3: Count how many images fit without placing them
+            capacity = self._circle_capacity(test_radius, square_reserve_size)
             
-            if all_fit:
+            if capacity >= num_bins:
                 # Step 5: If inside then decrease envelope area
-                self.logger.info(f"  ✓ All {len(placements)} images fit - decreasing envelope area")
+                self.logger.info("  ✓ All %d images fit - decreasing envelope area", num_bins)
                 max_radius = test_radius
                 best_radius = test_radius
-                best_placements = placements
             else:
                 # Step 4: If outside then increase envelope area  
-                self.logger.info(f"  ✗ Only {len(placements)}/{num_bins} images fit - increasing envelope area")
+                self.logger.info("  ✗ Only %d/%d images fit - increasing envelope area", capacity, num_bins)
                 min_radius = test_radius
         
         # Step 6: Stop at last area where envelope is larger than image area
         if best_radius is None:
             # Use the minimum working radius
             best_radius = max_radius
-            best_placements, _ = self._pack_images_in_circle_with_reserve(num_bins, best_radius, square_reserve_size)
+        best_placements, _ = self._pack_images_in_circle_with_reserve(num_bins, best_radius, square_reserve_size)
         
         final_canvas_size = int(2 * best_radius)
         final_envelope_area = math.pi * best_radius * best_radius
         efficiency = image_area / final_envelope_area * 100
         
-        self.logger.info(f"Binary search complete: radius={best_radius:.1f}, efficiency={efficiency:.1f}%")
+        self.logger.info("Binary search complete: radius=%.1f, efficiency=%.1f%%", best_radius, efficiency)
         
         # Calculate grid dimensions for compatibility
-        rows = int(final_canvas_size / self.bin_height)
-        cols = int(final_canvas_size / self.bin_width)
+        rows = final_canvas_size // self.bin_height
+        cols = final_canvas_size // self.bin_width
         
         return PackingResult(
             rows=rows,
@@ -1590,65 +1767,111 @@ class NanoFichePacker:
             bin_height=self.bin_height
         )
     
-    def _pack_images_in_circle_with_reserve(self, num_bins: int, circle_radius: float, square_reserve_size: int):
+    def _circle_row_span(self, dy: int, circle_radius: float, center_x: int, num_cols: int) -> Tuple[int, int]:
         """
-        Pack images row-by-row in circle with square reserve.
-        Returns: (placements, all_images_fit)
+        Columns [first, end) of a row whose tile centers lie inside the circle (dx² + dy² ≤ r²),
+        for a row whose tile center is dy from the center.
+        """
+        bin_width = self.bin_width
+        half_width = bin_width // 2
+        dy_sq = dy * dy
+        radius_sq = circle_radius * circle_radius
+        
+        def inside(col):
+            dx = col * bin_width + half_width - center_x
+            return dx * dx + dy_sq <= radius_sq
+        
+        # Passing columns are a contiguous run around the column closest to the center
+        nearest = min(max((center_x - half_width) // bin_width, 0), num_cols - 1)
+        if nearest + 1 < num_cols and abs((nearest + 1) * bin_width + half_width - center_x) < \
+                abs(nearest * bin_width + half_width - center_x):
+            nearest += 1
+        if num_cols <= 0 or not inside(nearest):
+            return 0, 0
+        
+        # Start from the chord estimate and settle each end with the exact test
+        half_chord = math.sqrt(max(0.0, radius_sq - dy_sq))
+        first = min(max(math.ceil((center_x - half_width - half_chord) / bin_width), 0), nearest)
+        while first > 0 and inside(first - 1):
+            first -= 1
+        while not inside(first):
+            first += 1
+        
+        last = max(min(math.floor((center_x - half_width + half_chord) / bin_width), num_cols - 1), nearest)
+        while last < num_cols - 1 and inside(last + 1):
+            last += 1
+        while not inside(last):
+            last -= 1
+        
+        return first, last + 1
+    
+    def _circle_row_intervals(self, circle_radius: float, square_reserve_size: int):
+        """
+        Yield (y, first_col, end_col) for each run of columns, top to bottom and left to right,
+        where _pack_images_in_circle_with_reserve places bins: the row's span inside the circle
+        minus the columns blocked by the center square reserve (0, 1 or 2 runs per row).
         """
+        bin_width = self.bin_width
+        bin_height = self.bin_height
+        half_height = bin_height // 2
         canvas_size = int(2 * circle_radius)
         center_x = center_y = canvas_size // 2
+        num_cols = canvas_size // bin_width
+        num_rows = canvas_size // bin_height
         
-        placements = []
-        images_placed = 0
-        
-        # Go row by row from top to bottom
-        current_y = 0
-        
-        while images_placed < num_bins and current_y + self.bin_height <= canvas_size:
-            # Place images left to right in this row
-            current_x = 0
-            
-            while images_placed < num_bins and current_x + self.bin_width <= canvas_size:
-                # Check if this position is valid
-                if self._is_position_inside_circle_and_outside_square(current_x, current_y, circle_radius, center_x, center_y, square_reserve_size):
-                    placements.append((current_x, current_y))
-                    images_placed += 1
-                
-                current_x += self.bin_width
-            
-            current_y += self.bin_height
-        
-        # Check if all images fit
-        all_images_fit = (images_placed == num_bins)
-        return placements, all_images_fit
-    
-    def _is_position_inside_circle_and_outside_square(self, x: int, y: int, circle_radius: float, 
-                                                    center_x: int, center_y: int, square_reserve_size: int) -> bool:
-        """Check if position is inside circle and outside square reserve."""
-        # Check if tile center is inside circle
-        tile_center_x = x + self.bin_width // 2
-        tile_center_y = y + self.bin_height // 2
-        distance_from_center = math.sqrt((tile_center_x - center_x)**2 + (tile_center_y - center_y)**2)
-        
-        if distance_from_center > circle_radius:
-            return False  # Outside circle
-        
-        # Check if tile overlaps with center square reserve
+        # Columns and row extent blocked by the center square reserve
         square_half_size = square_reserve_size // 2
-        square_left = center_x - square_half_size
-        square_right = center_x + square_half_size
+        reserve_first_col = max((center_x - square_half_size) // bin_width, 0)
+        reserve_end_col = min(-(-(center_x + square_half_size) // bin_width), num_cols)
         square_top = center_y - square_half_size
         square_bottom = center_y + square_half_size
         
-        # Tile bounds
-        tile_left = x
-        tile_right = x + self.bin_width
-        tile_top = y
-        tile_bottom = y + self.bin_height
+        for row in range(num_rows):
+            y = row * bin_height
+            first, end = self._circle_row_span(y + half_height - center_y, circle_radius, center_x, num_cols)
+            if first >= end:
+                continue
+            
+            if y + bin_height > square_top and y < square_bottom:
+                # Split the span around the reserve columns
+                if min(end, reserve_first_col) > first:
+                    yield y, first, min(end, reserve_first_col)
+                if end > max(first, reserve_end_col):
+                    yield y, max(first, reserve_end_col), end
+            else:
+                yield y, first, end
+    
+    def _circle_capacity(self, circle_radius: float, square_reserve_size: int) -> int:
+        """Count how many bins _pack_images_in_circle_with_reserve can place at this radius, without placing them."""
+        if NUMBA_AVAILABLE:
+            return circle_square_reserve_capacity(self.bin_width, self.bin_height, circle_radius, square_reserve_size)
+        return sum(end - first for _, first, end in self._circle_row_intervals(circle_radius, square_reserve_size))
+    
+    def _pack_images_in_circle_with_reserve(self, num_bins: int, circle_radius: float, square_reserve_size: int):
+        """
+        Pack images row-by-row in circle with square reserve.
+        Returns: (placements, all_images_fit)
+        """
+        if NUMBA_AVAILABLE:
+            out = np.empty((num_bins, 2), dtype=np.int32)
+            images_placed = sweep_circle_square_reserve(
+                self.bin_width, self.bin_height, circle_radius, square_reserve_size, num_bins, out
+            )
+            return out[:images_placed], images_placed == num_bins
+        
+        placements = np.empty((max(num_bins, 0), 2), dtype=np.int32)
+        images_placed = 0
         
-        # Check if tile overlaps with square reserve
-        if not (tile_right <= square_left or tile_left >= square_right or 
-                tile_bottom <= square_top or tile_top >= square_bottom):
-            return False  # Overlaps with square reserve
+        # Go row by row from top to bottom, filling each run of valid columns in one slice
+        for y, first, end in self._circle_row_intervals(circle_radius, square_reserve_size):
+            if images_placed >= num_bins:
+                break
+            end = min(end, first + num_bins - images_placed)
+            run = end - first
+            placements[images_placed:images_placed + run, 0] = np.arange(first, end) * self.bin_width
+            placements[images_placed:images_placed + run, 1] = y
+            images_placed += run
         
-        return True
+        # Check if all images fit
+        all_images_fit = (images_placed == num_bins)
+        return placements[:images_placed], all_images_fit
@@ -4,17 +4,67 @@ Handles TIFF generation with proper scaling and image placement.
 """
 
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 from datetime import datetime
 from pathlib import Path
-from typing import List
+from typing import List, Optional, Tuple
 from PIL import Image, ImageDraw
 import math
+import numpy as np
 
 from .image_bin import ImageBin
 from .packer import PackingResult, EnvelopeShape
 from .logger import log_project
 
 
+def _fit_image(img: Image.Image, max_width: int, max_height: int) -> Image.Image:
+    """Resize img to fit within max_width x max_height, keeping its aspect ratio and never upscaling."""
+    # Calculate scaling factor
+    width_ratio = max_width / img.width
+    height_ratio = max_height / img.height
+    scale_factor = min(width_ratio, height_ratio)
+    
+    # Don't upscale
+    if scale_factor > 1.0:
+        scale_factor = 1.0
+    
+    new_width = int(img.width * scale_factor)
+    new_height = int(img.height * scale_factor)
+    return img.resize((new_width, new_height), Image.Resampling.LANCZOS)
+
+
+def _load_bin_image(job: Tuple[Path, int, int, bool]) -> Tuple[Optional[Image.Image], Optional[str]]:
+    """
+    Open one source image, convert it to the canvas mode and resize it to its bin.
+    
+    Runs in the full-TIFF worker processes. Returns (image, None), or (None, error message)
+    if the file could not be read.
+    """
+    file_path, bin_width, bin_height, grayscale = job
+    try:
+        with Image.open(file_path) as img:
+            # Convert to grayscale if needed
+            if grayscale and img.mode != 'L':
+                img = img.convert('L')
+            elif not grayscale and img.mode == 'L':
+                img = img.convert('RGB')
+            
+            # Resize image to fit within bin (maintain aspect ratio)
+            return _fit_image(img, bin_width, bin_height), None
+    except Exception as e:
+        return None, str(e)
+
+
+def _grid_line_positions(num_cells: int, step: int, limit: int) -> range:
+    """Distinct grid line positions i * step, for i in 0..num_cells, that lie below limit."""
+    if step <= 0:
+        # Every line collapses onto the edge
+        return range(min(1, limit))
+    return range(0, min(num_cells * step, limit - 1) + 1, step)
+
+
 class NanoFicheRenderer:
     """Handles TIFF rendering for NanoFiche Image Prep."""
     
@@ -61,17 +111,28 @@ class NanoFicheRenderer:
         
         # Place images
         self.logger.info(f"Preview: Placing {len(image_bins)} images")
+        # Plain Python ints for the per-image coordinate arithmetic
+        placements = np.asarray(packing_result.placements).tolist()
+        
+        # Calculate scaled bin size
+        bin_width_scaled = int(packing_result.bin_width * scale_factor)
+        bin_height_scaled = int(packing_result.bin_height * scale_factor)
+        
         for i in range(len(image_bins)):
-            if i >= len(packing_result.placements):
+            if i >= len(placements):
                 self.logger.error(f"Preview: Missing placement for image {i}")
                 break
                 
-            x, y = packing_result.placements[i]
+            x, y = placements[i]
             image_bin = image_bins[i]
             
             try:
                 # Load and resize image
                 with Image.open(image_bin.file_path) as img:
+                    # Let JPEG sources decode at a reduced DCT scale, still at least twice the scaled bin,
+                    # before anything loads the full-resolution pixels; other formats ignore this
+                    img.draft(None, (max(1, bin_width_scaled * 2), max(1, bin_height_scaled * 2)))
+                    
                     # Convert to appropriate mode for preview
                     if not color and img.mode != 'L':
                         img = img.convert('L')
@@ -82,10 +143,6 @@ class NanoFicheRenderer:
                     scaled_x = int(x * scale_factor)
                     scaled_y = int(y * scale_factor)
                     
-                    # Calculate scaled bin size
-                    bin_width_scaled = int(packing_result.bin_width * scale_factor)
-                    bin_height_scaled = int(packing_result.bin_height * scale_factor)
-                    
                     # Resize image to fit within scaled bin
                     img_resized = self._resize_image_to_fit(img, bin_width_scaled, bin_height_scaled)
                     
@@ -130,10 +187,15 @@ class NanoFicheRenderer:
         self.logger.info(f"Preview TIFF saved: {output_path}")
     
     def generate_full_tiff(self, image_bins: List[ImageBin], packing_result: PackingResult,
-                          output_path: Path, log_path: Path, project_name: str, approved: bool = True, grayscale: bool = True):
+                          output_path: Path, log_path: Path, project_name: str, approved: bool = True, grayscale: bool = True,
+                          max_workers: int = 1):
         """
         Generate full resolution TIFF output.
         
+        Loading and resizing the source images is CPU-bound and independent per image, so with
+        max_workers > 1 it is fanned out to worker processes; the resized images are pasted onto
+        the canvas in order. Frozen executables must call multiprocessing.freeze_support() first.
+        
         Args:
             image_bins: List of image bins to place
             packing_result: Packing layout result
@@ -142,6 +204,7 @@ class NanoFicheRenderer:
             project_name: Project name for logging
             approved: Whether this was user-approved
             grayscale: Generate 8-bit grayscale instead of RGB (saves 66% memory)
+            max_workers: Number of worker processes (1 renders in-process, None uses the CPU count)
         """
         start_time = datetime.now()
         mode = "L" if grayscale else "RGB"
@@ -167,31 +230,24 @@ class NanoFicheRenderer:
             
             self.logger.info(f"Estimated memory usage: {memory_gb:.2f} GB ({'grayscale' if grayscale else 'RGB'})")
             
-            canvas = Image.new(mode, (canvas_width, canvas_height), color=bg_color)
-            
             # Place images at full resolution
             images_placed = 0
+            placements = np.asarray(packing_result.placements).tolist()
+            num_placed = min(len(image_bins), len(placements))
+            jobs = [(image_bin.file_path, packing_result.bin_width, packing_result.bin_height, grayscale)
+                    for image_bin in image_bins[:num_placed]]
             
-            for i in range(len(image_bins)):
-                if i >= len(packing_result.placements):
-                    self.logger.error(f"Missing placement for image {i}")
-                    break
-                    
-                x, y = packing_result.placements[i]
-                image_bin = image_bins[i]
+            # The pool is started before the canvas is allocated, so forked workers never copy it
+            with self._bin_image_pool(jobs, max_workers) as executor:
+                canvas = Image.new(mode, (canvas_width, canvas_height), color=bg_color)
                 
-                try:
-                    # Load image
-                    with Image.open(image_bin.file_path) as img:
-                        # Convert to grayscale if needed
-                        if grayscale and img.mode != 'L':
-                            img = img.convert('L')
-                        elif not grayscale and img.mode == 'L':
-                            img = img.convert('RGB')
-                        
-                        # Resize image to fit within bin (maintain aspect ratio)
-                        img_resized = self._resize_image_to_fit(img, packing_result.bin_width, packing_result.bin_height)
-                        
+                for (x, y), image_bin, (img_resized, error) in zip(placements, image_bins,
+                                                                  self._load_bin_images(jobs, executor, max_workers)):
+                    if img_resized is None:
+                        self.logger.error(f"Could not place image {image_bin.file_path}: {error}")
+                        continue
+                    
+                    try:
                         # Center image within bin
                         bin_center_x = x + packing_result.bin_width // 2
                         bin_center_y = y + packing_result.bin_height // 2
@@ -210,10 +266,13 @@ class NanoFicheRenderer:
                             canvas.paste(img_resized, (paste_x, paste_y))
                         
                         images_placed += 1
-                        
-                except Exception as e:
-                    self.logger.error(f"Could not place image {image_bin.file_path}: {e}")
-                    continue
+                    
+                    except Exception as e:
+                        self.logger.error(f"Could not place image {image_bin.file_path}: {e}")
+                        continue
+            
+            if num_placed < len(image_bins):
+                self.logger.error(f"Missing placement for image {num_placed}")
             
             # Save full TIFF with high quality
             canvas.save(output_path, format='TIFF', compression='lzw', dpi=(300, 300))
@@ -296,6 +355,35 @@ class NanoFicheRenderer:
         
         self.logger.info(f"Thumbnail TIFF completed: {output_path}")
     
+    def _bin_image_pool(self, jobs: List[Tuple[Path, int, int, bool]], max_workers: Optional[int]):
+        """
+        Worker pool for _load_bin_images, with its workers already running, or a null context
+        when the images are loaded in-process.
+        """
+        if max_workers == 1 or len(jobs) <= 1:
+            return nullcontext()
+        
+        executor = ProcessPoolExecutor(max_workers=max_workers)
+        # Workers are only launched on the first submit
+        executor.submit(os.getpid).result()
+        return executor
+    
+    def _load_bin_images(self, jobs: List[Tuple[Path, int, int, bool]], executor: Optional[ProcessPoolExecutor],
+                         max_workers: Optional[int]):
+        """
+        Yield _load_bin_image(job) for each job, in order.
+        
+        With an executor the jobs run in its worker processes, a batch at a time so that only a
+        bounded number of resized images wait to be pasted.
+        """
+        if executor is None:
+            yield from map(_load_bin_image, jobs)
+            return
+        
+        batch_size = (max_workers or os.cpu_count() or 1) * 16
+        for start in range(0, len(jobs), batch_size):
+            yield from executor.map(_load_bin_image, jobs[start:start + batch_size])
+    
     def _resize_image_to_fit(self, img: Image.Image, max_width: int, max_height: int) -> Image.Image:
         """
         Resize image to fit within specified dimensions while maintaining aspect ratio.
@@ -308,21 +396,7 @@ class NanoFicheRenderer:
         Returns:
             Resized image
         """
-        # Calculate scaling factor
-        width_ratio = max_width / img.width
-        height_ratio = max_height / img.height
-        scale_factor = min(width_ratio, height_ratio)
-        
-        # Don't upscale
-        if scale_factor > 1.0:
-            scale_factor = 1.0
-        
-        # Calculate new dimensions
-        new_width = int(img.width * scale_factor)
-        new_height = int(img.height * scale_factor)
-        
-        # Resize image
-        return img.resize((new_width, new_height), Image.Resampling.LANCZOS)
+        return _fit_image(img, max_width, max_height)
     
     def _add_grid_lines(self, canvas: Image.Image, packing_result: PackingResult, scale_factor: float):
         """
@@ -343,17 +417,13 @@ class NanoFicheRenderer:
         bin_width = int(packing_result.bin_width * scale_factor)
         bin_height = int(packing_result.bin_height * scale_factor)
         
-        # Draw vertical lines
-        for col in range(packing_result.columns + 1):
-            x = int(col * bin_width)
-            if x < canvas.width:
-                draw.line([(x, 0), (x, canvas.height - 1)], fill='lightgray', width=1)
+        # Draw vertical lines, only those that land on the canvas
+        for x in _grid_line_positions(packing_result.columns, bin_width, canvas.width):
+            draw.line([(x, 0), (x, canvas.height - 1)], fill='lightgray', width=1)
         
         # Draw horizontal lines
-        for row in range(packing_result.rows + 1):
-            y = int(row * bin_height)
-            if y < canvas.height:
-                draw.line([(0, y), (canvas.width - 1, y)], fill='lightgray', width=1)
+        for y in _grid_line_positions(packing_result.rows, bin_height, canvas.height):
+            draw.line([(0, y), (canvas.width - 1, y)], fill='lightgray', width=1)
     
     def _draw_reserved_space(self, canvas: Image.Image, packing_result: PackingResult, scale_factor: float):
         """
@@ -4,6 +4,7 @@ NanoFiche Image Prep - Windows Application
 Optimal bin packing for raster images into envelope shapes.
 """
 
+import multiprocessing
 import sys
 import tkinter as tk
 from pathlib import Path
@@ -20,4 +21,6 @@ def main():
     root.mainloop()
 
 if __name__ == "__main__":
+    # Worker processes of a frozen executable must not start another GUI
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""Test script checking that the Numba kernels and the NumPy fallback pack identically."""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(__file__))
+
+import numpy as np
+
+from nanofiche_core import _packing_kernels
+from nanofiche_core import packer as packer_module
+from nanofiche_core.packer import NanoFichePacker, EnvelopeSpec, EnvelopeShape
+
+
+def parity_specs():
+    """One spec per shape and reserve mode."""
+    return [
+        EnvelopeSpec(shape=EnvelopeShape.SQUARE),
+        EnvelopeSpec(shape=EnvelopeShape.SQUARE, reserve_enabled=True, reserve_width=4000, reserve_height=4000),
+        EnvelopeSpec(shape=EnvelopeShape.SQUARE, reserve_enabled=True, reserve_position="top-left",
+                     reserve_auto_size=True),
+        EnvelopeSpec(shape=EnvelopeShape.RECTANGLE, aspect_x=1.29, aspect_y=1.0),
+        EnvelopeSpec(shape=EnvelopeShape.RECTANGLE, aspect_x=1.29, aspect_y=1.0, reserve_enabled=True,
+                     reserve_width=4000, reserve_height=3000),
+        EnvelopeSpec(shape=EnvelopeShape.CIRCLE),
+        EnvelopeSpec(shape=EnvelopeShape.CIRCLE, reserve_enabled=True, reserve_width=5000, reserve_height=5000),
+        EnvelopeSpec(shape=EnvelopeShape.ELLIPSE, aspect_x=1.5, aspect_y=1.0),
+        EnvelopeSpec(shape=EnvelopeShape.CIRCLE_WITH_SQUARE_RESERVE, square_reserve_size=10000),
+    ]
+
+
+def pack_all(numba_available):
+    """Pack every parity spec for a few bin counts with the kernels switched on or off."""
+    saved = (_packing_kernels.NUMBA_AVAILABLE, packer_module.NUMBA_AVAILABLE)
+    _packing_kernels.NUMBA_AVAILABLE = packer_module.NUMBA_AVAILABLE = numba_available
+    try:
+        packer = NanoFichePacker(bin_width=1300, bin_height=1900)
+        return [packer.pack(num_bins, spec) for num_bins in (1, 37, 250) for spec in parity_specs()]
+    finally:
+        _packing_kernels.NUMBA_AVAILABLE, packer_module.NUMBA_AVAILABLE = saved
+
+
+def test_numba_fallback_parity():
+    """Placements and canvas sizes must not depend on whether Numba is used."""
+    compiled = pack_all(True)
+    fallback = pack_all(False)
+
+    for with_kernels, without_kernels in zip(compiled, fallback):
+        label = f"{with_kernels.envelope_shape.value} with {with_kernels.total_bins} bins"
+        print(f"{label}: canvas {with_kernels.canvas_width}x{with_kernels.canvas_height}")
+        assert (with_kernels.canvas_width, with_kernels.canvas_height) == \
+            (without_kernels.canvas_width, without_kernels.canvas_height), label
+        assert np.array_equal(with_kernels.placements, without_kernels.placements), label
+
+    print("✅ Numba kernels and NumPy fallback pack identically")
+
+
+if __name__ == "__main__":
+    test_numba_fallback_parity()
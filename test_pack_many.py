@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Test script for packing several envelope shapes concurrently."""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(__file__))
+
+from nanofiche_core import packer as packer_module
+from nanofiche_core.packer import NanoFichePacker, EnvelopeSpec, EnvelopeShape
+
+
+def test_pack_many():
+    """Concurrent packing must match packing each spec one at a time."""
+    packer = NanoFichePacker(bin_width=1300, bin_height=1900)
+
+    specs = [
+        (100, EnvelopeSpec(shape=EnvelopeShape.SQUARE)),
+        (100, EnvelopeSpec(shape=EnvelopeShape.RECTANGLE, aspect_x=1.29, aspect_y=1.0)),
+        (100, EnvelopeSpec(shape=EnvelopeShape.CIRCLE)),
+        (100, EnvelopeSpec(shape=EnvelopeShape.ELLIPSE, aspect_x=1.5, aspect_y=1.0)),
+        (100, EnvelopeSpec(shape=EnvelopeShape.CIRCLE_WITH_SQUARE_RESERVE, square_reserve_size=10000)),
+    ]
+
+    results = packer.pack_many(specs, max_workers=2)
+    assert len(results) == len(specs)
+
+    for (num_bins, spec), result in zip(specs, results):
+        expected = packer.pack(num_bins, spec)
+        print(f"{spec.shape.value}: canvas {result.canvas_width}x{result.canvas_height}, "
+              f"{len(result.placements)} placements")
+        assert result.envelope_shape == expected.envelope_shape
+        assert (result.canvas_width, result.canvas_height) == (expected.canvas_width, expected.canvas_height)
+        assert [tuple(p) for p in result.placements] == [tuple(p) for p in expected.placements]
+        assert result == expected
+
+    print("✅ pack_many matches sequential packing")
+
+
+def auto_reserve_spec():
+    """Square spec whose top-left reserve is resized by the packer."""
+    return EnvelopeSpec(shape=EnvelopeShape.SQUARE, reserve_enabled=True,
+                        reserve_position="top-left", reserve_auto_size=True)
+
+
+def test_pack_many_updates_specs():
+    """pack_many must leave each spec as pack() does, on threads and on worker processes."""
+    packer = NanoFichePacker(bin_width=1300, bin_height=1900)
+
+    expected_spec = auto_reserve_spec()
+    packer.pack(100, expected_spec)
+    assert expected_spec != auto_reserve_spec()
+
+    numba_available = packer_module.NUMBA_AVAILABLE
+    try:
+        for use_threads in (True, False):
+            packer_module.NUMBA_AVAILABLE = use_threads
+            spec = auto_reserve_spec()
+            results = packer.pack_many([(100, spec), (100, EnvelopeSpec(shape=EnvelopeShape.CIRCLE))], max_workers=2)
+            print(f"{'threads' if use_threads else 'processes'}: reserve {spec.reserve_width}x{spec.reserve_height}")
+            assert spec == expected_spec
+            assert results[0].envelope_spec is spec
+    finally:
+        packer_module.NUMBA_AVAILABLE = numba_available
+
+    print("✅ pack_many updates specs like pack")
+
+
+if __name__ == "__main__":
+    test_pack_many()
+    test_pack_many_updates_specs()